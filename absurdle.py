@@ -0,0 +1,98 @@
+"""
+File: absurdle.py
+Authors: Wordle game contributors
+Date: 17 October 2026
+Description: Adversarial Wordle (like Absurdle). There is no hidden word at the
+start; after every guess the game splits the answers still possible by the
+pattern they would give, keeps the largest group and reports its pattern. The
+split is one score_batch call and one count of the patterns, so a guess costs a
+few milliseconds even with the whole short list still possible.
+"""
+
+# Imports
+import numpy as np
+
+from batch_scoring import encode_words, score_batch
+from scoring import winning_pattern
+from session import GameSession
+
+MAX_BINCOUNT_SIZE = 1 << 24     # largest pattern space counted with bincount
+
+
+class AbsurdleSession(GameSession):
+    __slots__ = ("short_matrix", "candidates")
+
+    def __init__(self, short_list, long_list, word_size = 5, num_guesses = 6, rng = None):
+        """
+        Create a session whose answer is only chosen by the guesses made
+        """
+        GameSession.__init__(self, short_list, long_list, word_size, num_guesses, rng)
+        self.short_matrix = encode_words(list(short_list), word_size)
+        self.candidates = np.arange(len(short_list))   # indexes into short_list of the answers still possible
+
+    def start(self, word = None):
+        """
+        Start a game. There is no hidden word, so none can be given.
+        Returns an error message, or None if the game started.
+        """
+        if self.game_started == True:
+            return "Game already started"
+        if word != None:
+            return "Adversarial games have no hidden word"
+        if len(self.short_list) == 0:
+            return "No words of this length"
+
+        # The word is only chosen once the game is over
+        self.word = ""
+        self.game_started = True
+        return None
+
+    def remaining(self):
+        """
+        Words from the short list that could still be the answer
+        """
+        return [self.short_list[i] for i in self.candidates.tolist()]
+
+    def score_guess(self, guess):
+        """
+        Keep the largest group of possible answers that share a pattern for this
+        guess, and return that pattern
+        """
+        patterns = score_batch(guess, self.short_matrix[self.candidates])
+        num_patterns = 3 ** self.WORD_SIZE
+
+        if num_patterns <= MAX_BINCOUNT_SIZE:
+            # Count every pattern; ties go to the lowest pattern, so the winning
+            # pattern (the highest) is only given when nothing else is left
+            counts = np.bincount(patterns, minlength = num_patterns)
+            pattern = int(np.argmax(counts))
+        else:
+            # Too many patterns to count them all: sort and measure the runs instead
+            ordered = np.sort(patterns)
+            starts = np.flatnonzero(np.r_[True, ordered[1:] != ordered[:-1]])
+            counts = np.diff(np.r_[starts, len(ordered)])
+            pattern = int(ordered[starts[np.argmax(counts)]])
+
+        self.candidates = self.candidates[patterns == pattern]
+        # On the last guess, pick a word that fits every pattern, to report as the answer
+        if pattern == winning_pattern(self.WORD_SIZE) or self.guess_row == self.NUM_GUESSES:
+            self.choose_word()
+        return pattern
+
+    def choose_word(self):
+        """
+        Make the first answer still possible the hidden word, once the game is over
+        """
+        if len(self.candidates) > 0:
+            self.word = self.short_list[int(self.candidates[0])]
+
+    def restore_candidates(self):
+        """
+        Work out the answers still possible from the history, for a restored game
+        """
+        self.candidates = np.arange(len(self.short_list))
+        for guess, pattern in self.history:
+            self.candidates = self.candidates[score_batch(guess, self.short_matrix[self.candidates]) == pattern]
+        self.word = ""
+        if self.game_finished:
+            self.choose_word()
@@ -0,0 +1,63 @@
+"""
+File: batch_scoring.py
+Authors: Wordle game contributors
+Date: 17 October 2026
+Description: NumPy scoring of one guess against many answers at once. Gives the
+same patterns as scoring.score, including for repeated letters.
+"""
+
+# Imports
+import numpy as np
+
+from scoring import GREEN, ORANGE
+
+
+def encode_words(words, word_size = None):
+    """
+    Turn a list of lowercase words into an (N, word size) uint8 matrix of
+    letter numbers (a = 0, ..., z = 25)
+    """
+    if word_size is None:
+        word_size = len(words[0]) if len(words) > 0 else 0
+    data = "".join(words).encode("ascii")
+    letters = np.frombuffer(data, dtype = np.uint8) - ord('a')
+    return letters.reshape(len(words), word_size)
+
+
+def pattern_dtype(word_size):
+    """
+    Smallest unsigned type that holds every pattern of a word size
+    """
+    if 3 ** word_size <= 256:
+        return np.uint8
+    if 3 ** word_size <= 65536:
+        return np.uint16
+    return np.uint32
+
+
+def score_batch(guess, answers):
+    """
+    Score a lowercase guess against an (N, word size) matrix of encoded answers
+    and return the N patterns
+    """
+    word_size = answers.shape[1]
+    guess = encode_words([guess], word_size)[0]
+
+    # Greens are letters that match in the same position
+    green = answers == guess
+    not_green = ~green
+
+    # For every guess position, how many unmatched answer letters are the same letter
+    same_letter = answers[:, None, :] == guess[None, :, None]
+    available = (same_letter & not_green[:, None, :]).sum(axis = 2)
+
+    # For every guess position, how many earlier unmatched guess positions used the same letter
+    earlier = (guess[None, :] == guess[:, None]) & np.tri(word_size, k = -1, dtype = bool)
+    used = not_green.astype(np.int32) @ earlier.T.astype(np.int32)
+
+    # Oranges take the unmatched answer letters from left to right
+    orange = not_green & (available > used)
+
+    powers = 3 ** np.arange(word_size, dtype = np.int64)
+    colors = green * GREEN + orange * ORANGE
+    return (colors @ powers).astype(pattern_dtype(word_size))
@@ -0,0 +1,102 @@
+"""
+File: constraints.py
+Authors: Wordle game contributors
+Date: 17 October 2026
+Description: What the patterns of the guesses so far say about the hidden word.
+Updated once per guess, so checking a new guess never replays earlier rows. Used
+for hard mode and for filtering word lists down to the words still possible.
+"""
+
+# Imports
+from scoring import decode, ORANGE, GREEN
+
+ORD_A = ord('a')
+ORDINALS = ["1st", "2nd", "3rd"] + [str(i) + "th" for i in range(4, 21)]
+
+
+class Constraints:
+    __slots__ = ("WORD_SIZE", "fixed", "not_at", "min_counts", "max_counts", "required")
+
+    def __init__(self, word_size):
+        """
+        Start with no information about a word of the given size
+        """
+        self.WORD_SIZE = word_size
+        self.fixed = [None] * word_size                     # letter known to be at every position
+        self.not_at = [set() for i in range(word_size)]     # letters known not to be at every position
+        self.min_counts = [0] * 26                          # fewest times every letter appears
+        self.max_counts = [word_size] * 26                  # most times every letter appears
+        self.required = []                                  # letters with a minimum count above 0
+
+    def update(self, guess, pattern):
+        """
+        Add what the pattern of one guess says about the hidden word
+        """
+        colors = decode(pattern, self.WORD_SIZE)
+        found = [0] * 26
+        grayed = [False] * 26
+
+        for i in range(self.WORD_SIZE):
+            index = ord(guess[i]) - ORD_A
+            if colors[i] == GREEN:
+                self.fixed[i] = guess[i]
+                found[index] += 1
+            else:
+                self.not_at[i].add(guess[i])
+                if colors[i] == ORANGE:
+                    found[index] += 1
+                else:
+                    grayed[index] = True
+
+        for letter in set(guess):
+            index = ord(letter) - ORD_A
+            if found[index] > self.min_counts[index]:
+                if self.min_counts[index] == 0:
+                    self.required.append(letter)
+                self.min_counts[index] = found[index]
+
+            # A gray letter means the word has exactly as many as were found
+            if grayed[index]:
+                self.max_counts[index] = found[index]
+
+    def check_hard_mode(self, guess):
+        """
+        Check a guess uses every revealed hint. Returns an error message, or None.
+        """
+        for i in range(self.WORD_SIZE):
+            if self.fixed[i] != None and guess[i] != self.fixed[i]:
+                return ORDINALS[i] + " letter must be " + self.fixed[i].upper()
+
+        counts = [0] * 26
+        for letter in guess:
+            counts[ord(letter) - ORD_A] += 1
+        for letter in self.required:
+            if counts[ord(letter) - ORD_A] < self.min_counts[ord(letter) - ORD_A]:
+                return "Guess must contain " + letter.upper()
+        return None
+
+    def matches(self, word):
+        """
+        Check if a word could still be the hidden word
+        """
+        for i in range(self.WORD_SIZE):
+            letter = word[i]
+            if self.fixed[i] != None:
+                if letter != self.fixed[i]:
+                    return False
+            elif letter in self.not_at[i]:
+                return False
+
+        counts = [0] * 26
+        for letter in word:
+            counts[ord(letter) - ORD_A] += 1
+        for index in range(26):
+            if counts[index] < self.min_counts[index] or counts[index] > self.max_counts[index]:
+                return False
+        return True
+
+    def filter(self, words):
+        """
+        Words from a list that could still be the hidden word
+        """
+        return [word for word in words if self.matches(word)]
@@ -0,0 +1,36 @@
+"""
+File: daily.py
+Authors: Wordle game contributors
+Date: 17 October 2026
+Description: Daily and numbered puzzles. Puzzle n is the n-th word of a fixed
+shuffled order of the short list (stored in the word list cache), so every
+machine picks the same word for a day without talking to any other, and no word
+repeats until the whole list has been used.
+"""
+
+# Imports
+import datetime
+
+from wordlist_cache import load_puzzle_order, load_words
+
+FIRST_PUZZLE_DATE = datetime.date(2022, 5, 16)  # date of puzzle number 0
+
+
+def puzzle_number(date = None, tz = datetime.timezone.utc):
+    """
+    Number of the puzzle for a date. By default it is today's date in the time
+    zone tz, UTC unless given, so every machine is on the same puzzle at once.
+    """
+    if date == None:
+        date = datetime.datetime.now(tz).date()
+    return (date - FIRST_PUZZLE_DATE).days
+
+
+def puzzle_word(filename, word_size, number):
+    """
+    Hidden word of a numbered puzzle, or None if there are no words of that size
+    """
+    order = load_puzzle_order(filename, word_size)
+    if len(order) == 0:
+        return None
+    return load_words(filename, word_size)[order[number % len(order)]]
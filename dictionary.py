@@ -0,0 +1,182 @@
+"""
+File: dictionary.py
+Authors: Wordle game contributors
+Date: 17 October 2026
+Description: Word dictionary used by the Wordle game for fast lookups.
+"""
+
+# Imports
+from bisect import bisect_left, bisect_right
+
+
+def open_word_file(filename):
+    """
+    Open a word file for reading text, decompressing .gz, .xz, .bz2 and .zst files
+    """
+    # Every decompressor is only imported for its own kind of file
+    options = {"encoding": "utf-8", "errors": "replace"}
+    if filename.endswith(".gz"):
+        import gzip
+        return gzip.open(filename, "rt", **options)
+    if filename.endswith(".xz"):
+        import lzma
+        return lzma.open(filename, "rt", **options)
+    if filename.endswith(".bz2"):
+        import bz2
+        return bz2.open(filename, "rt", **options)
+    if filename.endswith(".zst"):
+        # Zstandard is in the standard library from Python 3.14, and otherwise
+        # needs the zstandard package
+        try:
+            from compression import zstd
+        except ImportError:
+            import zstandard as zstd
+        return zstd.open(filename, "rt", **options)
+    return open(filename, **options)
+
+
+def read_lines(filenames):
+    """
+    Yield every line of one or more word files (for example several language
+    packs), reading one line at a time and closing every file when done
+    """
+    for filename in filenames:
+        with open_word_file(filename) as file:
+            yield from file
+
+
+def first_words(lines):
+    """
+    Yield the first word of every line, skipping blank lines and # comments
+    """
+    for line in lines:
+        fields = line.split(None, 1)
+        if fields and not fields[0].startswith("#"):
+            yield fields[0]
+
+
+def normalize_words(words, dropped = None):
+    """
+    Yield words in lowercase, dropping any with characters other than a to z
+    (such as accented letters), which can not be typed or scored. If
+    dropped is a Counter, it counts every word dropped.
+    """
+    for word in words:
+        word = word.lower()
+        if word.isascii() and word.isalpha():
+            yield word
+        elif dropped != None:
+            dropped[word] += 1
+
+
+def read_partitions(filenames, sizes = None, dropped = None):
+    """
+    Stream one or more word files into {word size: sorted unique words}, keeping
+    only the given word sizes (all sizes if None). Memory grows with the number
+    of unique words kept, not with the size of the files. If dropped is a
+    Counter, it counts the words dropped by normalize_words.
+    """
+    if isinstance(filenames, str):
+        filenames = [filenames]
+
+    partitions = {}
+    for word in normalize_words(first_words(read_lines(filenames)), dropped):
+        size = len(word)
+        if sizes == None or size in sizes:
+            partition = partitions.get(size)
+            if partition == None:
+                partition = partitions[size] = set()
+            partition.add(word)
+    return {size: sorted(words) for size, words in partitions.items()}
+
+
+def write_word_file(filename, partitions):
+    """
+    Write {word size: words} to a plain word file, one word per line, shortest first
+    """
+    with open(filename, "w", encoding = "utf-8") as file:
+        for size in sorted(partitions):
+            for word in partitions[size]:
+                file.write(word + "\n")
+
+
+def dropped_message(dropped):
+    """
+    Describe the words counted in a dropped Counter, with a few examples
+    """
+    examples = ", ".join(word for word, count in dropped.most_common(5))
+    return ("Skipped " + str(sum(dropped.values())) + " words with letters other than a to z"
+        + " (such as " + examples + ")")
+
+
+class WordDictionary:
+    def __init__(self, words):
+        """
+        Build the dictionary from any iterable of words
+        """
+        # Sorted, array backed index used for prefix and range queries
+        self.sorted_words = tuple(sorted(set(words)))
+
+        # Hashed set used for constant time membership checks
+        self.word_set = frozenset(self.sorted_words)
+
+    def __contains__(self, word):
+        """
+        Check if a word is in the dictionary
+        """
+        return word in self.word_set
+
+    def __len__(self):
+        """
+        Number of words in the dictionary
+        """
+        return len(self.sorted_words)
+
+    def __getitem__(self, index):
+        """
+        Get the word at an index of the sorted index (lets random.choice work)
+        """
+        return self.sorted_words[index]
+
+    def __iter__(self):
+        """
+        Iterate over the words in sorted order
+        """
+        return iter(self.sorted_words)
+
+    def words_in_range(self, low, high):
+        """
+        Return all words w with low <= w < high, in sorted order
+        """
+        start = bisect_left(self.sorted_words, low)
+        end = bisect_left(self.sorted_words, high)
+        return self.sorted_words[start:end]
+
+    def words_with_prefix(self, prefix):
+        """
+        Return all words starting with prefix, in sorted order
+        """
+        start = bisect_left(self.sorted_words, prefix)
+        end = bisect_right(self.sorted_words, prefix + "\U0010ffff")
+        return self.sorted_words[start:end]
+
+
+if __name__ == "__main__":
+    # Merge word files (compressed or not) into one plain word file:
+    #     python dictionary.py OUTPUT INPUT... [--sizes 4-10]
+    import argparse
+    from collections import Counter
+
+    parser = argparse.ArgumentParser(description = "Merge word files into one plain word file")
+    parser.add_argument("output", help = "word file to write")
+    parser.add_argument("inputs", nargs = "+", help = "word files to read (.gz, .xz, .bz2 and .zst are decompressed)")
+    parser.add_argument("--sizes", default = "4-10", help = "word sizes to keep, as MIN-MAX")
+    args = parser.parse_args()
+
+    low, high = (int(size) for size in args.sizes.split("-"))
+    dropped = Counter()
+    partitions = read_partitions(args.inputs, range(low, high + 1), dropped)
+    write_word_file(args.output, partitions)
+    print(str(sum(len(words) for words in partitions.values())) + " words written to " + args.output)
+    if dropped:
+        print(dropped_message(dropped))
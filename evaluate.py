@@ -0,0 +1,255 @@
+"""
+File: evaluate.py
+Authors: Wordle game contributors
+Date: 17 October 2026
+Description: Bulk scoring of recorded guesses and games with the real game rules.
+Reads CSV or JSONL from a file or stdin, checks and scores every row in chunks
+spread over a process pool, and writes one JSON line per row. Only a few chunks
+are in memory at once, so inputs of any size can be audited.
+
+    python evaluate.py [INPUT] [--output FILE] [--workers N] [--chunk-size N] [--guesses N]
+                       [--no-word-check] [--hard]
+
+Input rows are either a single guess or a whole game:
+    CSV     guess,answer            (header optional)
+            answer,guesses          (header needed; guesses separated by spaces)
+    JSONL   {"guess": "crane", "answer": "water"}
+            {"answer": "water", "guesses": ["crane", "later", "water"]}
+
+Output rows (JSONL):
+    {"line": 1, "answer": ..., "guess": ..., "pattern": 93, "colors": "01101", "error": null}
+    {"line": 2, "answer": ..., "guesses": [...], "colors": [...], "result": "WON", "error": null}
+
+A game is WON, LOST (every guess used) or PLAYING (guesses left), or INVALID if
+the rules reject it or it has more guesses than allowed (6 by default). A
+summary with the number of rows per second is printed to stderr.
+"""
+
+# Imports
+import argparse
+import collections
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from scoring import decode, MAX_WORD_SIZE
+from session import GameSession
+from wordlist_cache import load_dictionary
+
+LONG_WORDLIST_FILENAME = "long_wordlist.txt"
+SHORT_WORDLIST_FILENAME = "short_wordlist.txt"
+DEFAULT_CSV_COLUMNS = ["guess", "answer"]
+NUM_GUESSES = 6
+NOT_JSON = object()     # stands in for a line that could not be parsed
+
+# Rules used by every worker process, set by init_worker
+worker_rules = None
+
+
+def init_worker(word_check, hard_mode, num_guesses = NUM_GUESSES):
+    """
+    Remember the rules to check rows with in every worker process
+    """
+    global worker_rules
+    worker_rules = (word_check, hard_mode, num_guesses)
+
+
+def new_session(answer):
+    """
+    Start a session with the given hidden word. Returns (session, error message).
+    """
+    word_check, hard_mode, num_guesses = worker_rules
+    if not (0 < len(answer) <= MAX_WORD_SIZE):
+        return None, "Unsupported word length"
+
+    # Word lists are loaded once per word size in every worker
+    session = GameSession(load_dictionary(SHORT_WORDLIST_FILENAME, len(answer)),
+        load_dictionary(LONG_WORDLIST_FILENAME, len(answer)), len(answer), num_guesses)
+    session.guesses_must_be_words = word_check
+    session.hard_mode = hard_mode
+    return session, session.start(answer)
+
+
+def colors_text(pattern, word_size):
+    """
+    Pattern as one digit per letter (0 = gray, 1 = orange, 2 = green)
+    """
+    return "".join(str(color) for color in decode(pattern, word_size))
+
+
+def evaluate_guess(answer, guess):
+    """
+    Check and score one guess against an answer
+    """
+    row = {"answer": answer, "guess": guess, "pattern": None, "colors": None, "error": None}
+    session, error = new_session(answer)
+    if error != None:
+        row["error"] = error
+        return row
+
+    message = session.enter_word(guess)
+    if len(session.history) == 0:
+        row["error"] = message
+    else:
+        row["pattern"] = session.history[0][1]
+        row["colors"] = colors_text(row["pattern"], session.WORD_SIZE)
+    return row
+
+
+def evaluate_game(answer, guesses):
+    """
+    Replay a recorded game, stopping at the first guess the rules reject
+    """
+    row = {"answer": answer, "guesses": guesses, "colors": [], "result": "INVALID", "error": None}
+    session, error = new_session(answer)
+    if error != None:
+        row["error"] = error
+        return row
+    if len(guesses) > session.NUM_GUESSES:
+        row["error"] = "More than " + str(session.NUM_GUESSES) + " guesses"
+        return row
+
+    for guess in guesses:
+        guesses_made = len(session.history)
+        message = session.enter_word(guess)
+        if len(session.history) == guesses_made:
+            row["error"] = message
+            return row
+        row["colors"].append(colors_text(session.history[-1][1], session.WORD_SIZE))
+
+    row["result"] = "WON" if session.game_won else "LOST" if session.game_finished else "PLAYING"
+    return row
+
+
+def evaluate_record(record):
+    """
+    Evaluate one parsed input row, a guess or a whole game
+    """
+    answer = record.get("answer")
+    guess = record.get("guess")
+    guesses = record.get("guesses")
+    if isinstance(guesses, str):
+        guesses = guesses.split()
+    if not isinstance(answer, (str, type(None))) or not isinstance(guess, (str, type(None))):
+        return {"error": "Answer and guess must be strings"}
+    if "guesses" in record and not (isinstance(guesses, list) and all(isinstance(word, str) for word in guesses)):
+        return {"error": "Guesses must be a list of strings"}
+
+    answer = (answer or "").strip()
+    if "guesses" in record:
+        return evaluate_game(answer, [word.strip() for word in guesses])
+    return evaluate_guess(answer, (guess or "").strip())
+
+
+def evaluate_chunk(lines, first_line, input_format, columns):
+    """
+    Evaluate a chunk of input lines. Returns (output text, rows, rows with an error).
+    """
+    output = []
+    invalid = 0
+    if input_format == "jsonl":
+        records = []
+        for line in lines:
+            try:
+                records.append(json.loads(line) if line.strip() else None)
+            except ValueError:
+                records.append(NOT_JSON)
+    else:
+        records = [dict(zip(columns, values)) if values else None for values in csv.reader(lines)]
+
+    for i in range(len(records)):
+        record = records[i]
+        if record == None:
+            continue
+        if record is NOT_JSON:
+            row = {"error": "Not valid JSON"}
+        elif not isinstance(record, dict):
+            row = {"error": "Row is not a JSON object"}
+        else:
+            row = evaluate_record(record)
+        if row["error"] != None:
+            invalid += 1
+        output.append(json.dumps(dict(line = first_line + i, **row)))
+
+    text = "\n".join(output) + "\n" if output else ""
+    return text, len(output), invalid
+
+
+def evaluate(input_file, output_file, workers = None, chunk_size = 10000, word_check = True, hard_mode = False,
+        num_guesses = NUM_GUESSES):
+    """
+    Evaluate every row of an input file across a process pool, writing the
+    results in input order, and return a summary dictionary
+    """
+    workers = workers or os.cpu_count()
+    start_time = time.perf_counter()
+
+    # The first line tells JSONL from CSV, and a CSV header names the columns
+    first = input_file.readline()
+    line_number = 1
+    columns = DEFAULT_CSV_COLUMNS
+    input_format = "jsonl" if first.lstrip().startswith("{") else "csv"
+    pending_lines = [first]
+    if input_format == "csv":
+        header = [name.strip().lower() for name in next(csv.reader([first]), [])]
+        if "answer" in header:
+            columns = header
+            pending_lines = []
+            line_number = 2
+
+    rows = 0
+    invalid = 0
+    with ProcessPoolExecutor(max_workers = workers, initializer = init_worker,
+            initargs = (word_check, hard_mode, num_guesses)) as pool:
+        # Keep at most two chunks per worker in flight, so memory stays bounded
+        in_flight = collections.deque()
+        while True:
+            lines = pending_lines + list(islice(input_file, chunk_size - len(pending_lines)))
+            pending_lines = []
+            if lines:
+                in_flight.append(pool.submit(evaluate_chunk, lines, line_number, input_format, columns))
+                line_number += len(lines)
+            if in_flight and (not lines or len(in_flight) >= 2 * workers):
+                text, chunk_rows, chunk_invalid = in_flight.popleft().result()
+                output_file.write(text)
+                rows += chunk_rows
+                invalid += chunk_invalid
+            elif not lines:
+                break
+
+    elapsed = time.perf_counter() - start_time
+    return {
+        "rows": rows,
+        "invalid_rows": invalid,
+        "workers": workers,
+        "seconds": round(elapsed, 3),
+        "rows_per_sec": round(rows / elapsed, 1) if elapsed > 0 else 0.0,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Check and score recorded Wordle guesses and games")
+    parser.add_argument("input", nargs = "?", help = "CSV or JSONL file to read (stdin by default)")
+    parser.add_argument("--output", help = "JSONL file to write (stdout by default)")
+    parser.add_argument("--workers", type = int, default = None)
+    parser.add_argument("--chunk-size", type = int, default = 10000, help = "input lines per worker task")
+    parser.add_argument("--guesses", type = int, default = NUM_GUESSES, help = "most guesses a game may have")
+    parser.add_argument("--no-word-check", action = "store_true", help = "allow guesses and answers that are not words")
+    parser.add_argument("--hard", action = "store_true", help = "check games with the hard mode rules")
+    args = parser.parse_args()
+
+    input_file = open(args.input, newline = "") if args.input else sys.stdin
+    output_file = open(args.output, "w") if args.output else sys.stdout
+    try:
+        summary = evaluate(input_file, output_file, args.workers, args.chunk_size,
+            not args.no_word_check, args.hard, args.guesses)
+    finally:
+        if args.input:
+            input_file.close()
+        if args.output:
+            output_file.close()
+    print(json.dumps(summary), file = sys.stderr)
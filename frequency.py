@@ -0,0 +1,105 @@
+"""
+File: frequency.py
+Authors: Wordle game contributors
+Date: 17 October 2026
+Description: Optional word weights, so common words are picked as answers more
+often and hints know which answers are likely. Weights come from a sidecar file
+next to the word file (short_wordlist.txt.freq, lines of "word weight") or from
+a second column in the word file itself. Answers are drawn with the alias
+method: O(n) to build once, then O(1) per draw for any number of words.
+"""
+
+# Imports
+import os
+import random
+from array import array
+
+from dictionary import normalize_words, read_lines
+
+
+def weights_filename(filename):
+    """
+    Name of the sidecar weights file of a word file
+    """
+    return filename + ".freq"
+
+
+def read_weights(filename):
+    """
+    Return {word: weight} for a word file, from its sidecar file if there is
+    one or else from its second column, or None if it has no weights
+    """
+    path = weights_filename(filename)
+    if not os.path.exists(path):
+        path = filename
+
+    weights = {}
+    for line in read_lines([path]):
+        fields = line.split()
+        if not fields or fields[0].startswith("#"):
+            continue
+        if len(fields) < 2:
+            # A word file without a frequency column is not read any further
+            if len(weights) == 0:
+                return None
+            continue
+        try:
+            weight = float(fields[1])
+        except ValueError:
+            continue
+        for word in normalize_words(fields[:1]):
+            if weight > 0:
+                weights[word] = weights.get(word, 0.0) + weight
+    return weights or None
+
+
+def word_weights(words, weights):
+    """
+    Weight of every word of a list, in order. Words without a weight get the
+    smallest weight there is, so they can still come up.
+    """
+    smallest = min(weights.values())
+    return array("d", [weights.get(word, smallest) for word in words])
+
+
+class AliasSampler:
+    __slots__ = ("probability", "alias")
+
+    def __init__(self, weights):
+        """
+        Build the alias tables (Vose's method) for a list of positive weights
+        """
+        count = len(weights)
+        total = sum(weights)
+        if count == 0 or total <= 0:
+            raise ValueError("Weights must have a positive total")
+
+        # Every index keeps a share of its own slot and gives the rest to one alias
+        scaled = [weight * count / total for weight in weights]
+        self.probability = array("d", [1.0]) * count
+        self.alias = array("I", range(count))
+        small = [i for i in range(count) if scaled[i] < 1.0]
+        large = [i for i in range(count) if scaled[i] >= 1.0]
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            self.probability[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] += scaled[less] - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+
+    def __len__(self):
+        """
+        Number of indexes that can be drawn
+        """
+        return len(self.probability)
+
+    def sample(self, rng = random):
+        """
+        Draw an index with probability proportional to its weight, in O(1)
+        """
+        i = int(rng.random() * len(self.probability))
+        return i if rng.random() < self.probability[i] else self.alias[i]
@@ -0,0 +1,210 @@
+"""
+File: history.py
+Authors: Wordle game contributors
+Date: 17 October 2026
+Description: Game history kept in an SQLite database in WAL mode. Writes are put
+on a queue and done by a background thread in batches, one commit per batch, so
+recording a guess never waits on the disk. A multi-board game is kept as one
+game per board, with that board's word and patterns. Run "python history.py"
+for stats.
+"""
+
+# Imports
+import queue
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+
+HISTORY_FILENAME = "wordle_history.db"
+LOCK_RETRIES = 5            # times a batch is tried again while the database is locked
+LOCK_RETRY_DELAY = 0.1      # seconds before the first retry, doubled after every one
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id TEXT PRIMARY KEY,
+    word TEXT NOT NULL,
+    word_size INTEGER NOT NULL,
+    num_guesses INTEGER NOT NULL,
+    started REAL NOT NULL,
+    finished REAL,
+    won INTEGER,
+    guesses INTEGER
+);
+CREATE TABLE IF NOT EXISTS guesses (
+    game_id TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    guess TEXT NOT NULL,
+    pattern INTEGER NOT NULL,
+    PRIMARY KEY (game_id, number)
+);
+CREATE INDEX IF NOT EXISTS games_finished ON games (finished);
+"""
+
+
+def connect(path):
+    """
+    Open the database in WAL mode and make sure the tables exist
+    """
+    connection = sqlite3.connect(path, check_same_thread = False)
+    connection.execute("PRAGMA journal_mode = WAL")
+    connection.execute("PRAGMA synchronous = NORMAL")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def is_locked(error):
+    """
+    Whether an SQLite error only means another connection holds a lock
+    """
+    return isinstance(error, sqlite3.OperationalError) and "locked" in str(error)
+
+
+class HistoryStore:
+    def __init__(self, path = HISTORY_FILENAME, batch_size = 256):
+        """
+        Open the store and start its background writer thread
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.writes = queue.Queue()
+        self.writer = threading.Thread(target = self.write_loop, args = (connect(path),), daemon = True)
+        self.writer.start()
+
+    def write_loop(self, connection):
+        """
+        Background thread: apply queued writes in batches until close() is called
+        """
+        running = True
+        while running:
+            batch = [self.writes.get()]
+
+            # Take whatever else is already waiting, up to a full batch
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.writes.get_nowait())
+                except queue.Empty:
+                    break
+
+            # close() puts None on the queue; it is not part of any transaction
+            writes = [item for item in batch if item != None]
+            running = len(writes) == len(batch)
+
+            error = self.write_batch(connection, writes)
+            if error != None and len(writes) > 1 and not is_locked(error):
+                # The batch was rolled back; write it one statement at a time so
+                # only the statement that fails is lost
+                for item in writes:
+                    error = self.write_batch(connection, [item])
+                    if error != None:
+                        print("History not saved: " + str(error), file = sys.stderr)
+            elif error != None:
+                print("History not saved: " + str(error), file = sys.stderr)
+        connection.close()
+
+    def write_batch(self, connection, writes):
+        """
+        Apply writes in one transaction, trying again for a while if the
+        database is locked. Returns the error if they were rolled back, or None.
+        """
+        delay = LOCK_RETRY_DELAY
+        for attempt in range(LOCK_RETRIES + 1):
+            try:
+                with connection:
+                    for item in writes:
+                        connection.execute(*item)
+                return None
+            except sqlite3.Error as error:
+                if not is_locked(error) or attempt == LOCK_RETRIES:
+                    return error
+            time.sleep(delay)
+            delay *= 2
+
+    def start_game(self, word, word_size, num_guesses):
+        """
+        Record a new game and return its id
+        """
+        game_id = uuid.uuid4().hex
+        self.writes.put(("INSERT INTO games (id, word, word_size, num_guesses, started) VALUES (?, ?, ?, ?, ?)",
+            (game_id, word, word_size, num_guesses, time.time())))
+        return game_id
+
+    def record_guess(self, game_id, number, guess, pattern):
+        """
+        Record a submitted guess and its pattern
+        """
+        self.writes.put(("INSERT INTO guesses (game_id, number, guess, pattern) VALUES (?, ?, ?, ?)",
+            (game_id, number, guess, pattern)))
+
+    def finish_game(self, game_id, won, guesses):
+        """
+        Record the result of a game
+        """
+        self.writes.put(("UPDATE games SET finished = ?, won = ?, guesses = ? WHERE id = ?",
+            (time.time(), int(won), guesses, game_id)))
+
+    def close(self):
+        """
+        Write everything still queued and stop the writer thread
+        """
+        self.writes.put(None)
+        self.writer.join()
+
+
+class HistoryStats:
+    def __init__(self, path = HISTORY_FILENAME):
+        """
+        Open the store for queries (readers do not block the writer in WAL mode)
+        """
+        self.connection = connect(path)
+
+    def guess_distribution(self):
+        """
+        Number of won games for every number of guesses, plus "X" for lost games
+        """
+        distribution = {}
+        for guesses, count in self.connection.execute(
+                "SELECT guesses, COUNT(*) FROM games WHERE won = 1 GROUP BY guesses ORDER BY guesses"):
+            distribution[str(guesses)] = count
+        lost = self.connection.execute("SELECT COUNT(*) FROM games WHERE won = 0").fetchone()[0]
+        distribution["X"] = lost
+        return distribution
+
+    def win_streaks(self):
+        """
+        Return (current streak, longest streak) of won games in a row
+        """
+        current = 0
+        longest = 0
+        for (won,) in self.connection.execute("SELECT won FROM games WHERE finished IS NOT NULL ORDER BY finished"):
+            current = current + 1 if won else 0
+            longest = max(longest, current)
+        return current, longest
+
+    def hardest_words(self, limit = 10, min_games = 1):
+        """
+        Words with the highest average number of guesses (a lost game counts as
+        one more than the number of guesses allowed), as (word, games, average)
+        """
+        return self.connection.execute(
+            "SELECT word, COUNT(*), AVG(CASE WHEN won = 1 THEN guesses ELSE num_guesses + 1 END) AS average "
+            "FROM games WHERE finished IS NOT NULL GROUP BY word HAVING COUNT(*) >= ? "
+            "ORDER BY average DESC, word LIMIT ?", (min_games, limit)).fetchall()
+
+    def close(self):
+        """
+        Close the connection
+        """
+        self.connection.close()
+
+
+if __name__ == "__main__":
+    stats = HistoryStats(sys.argv[1] if len(sys.argv) > 1 else HISTORY_FILENAME)
+    current, longest = stats.win_streaks()
+    print("Guess distribution = " + str(stats.guess_distribution()))
+    print("Current streak = " + str(current) + ", longest streak = " + str(longest))
+    print("Hardest words:")
+    for word, games, average in stats.hardest_words():
+        print("    " + word + " (" + str(games) + " games, " + str(round(average, 2)) + " guesses)")
+    stats.close()
@@ -0,0 +1,85 @@
+"""
+File: loadgen.py
+Authors: Wordle game contributors
+Date: 17 October 2026
+Description: Load generator for server.py. Opens many connections that play
+random games at the same time and reports GUESS latency percentiles.
+
+    python loadgen.py [--host HOST] [--port PORT] [--connections N] [--games N] [--word-size N]
+"""
+
+# Imports
+import argparse
+import asyncio
+import random
+import time
+
+from server import DEFAULT_PORT
+from wordlist_cache import load_words
+
+
+def percentile(sorted_values, fraction):
+    """
+    Value at a fraction (0 to 1) of a sorted list
+    """
+    if len(sorted_values) == 0:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+async def player(host, port, games, guesses, latencies, rng):
+    """
+    Play a number of games on one connection, recording every GUESS round trip
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    for game in range(games):
+        writer.write(b"NEW\n")
+        await writer.drain()
+        await reader.readline()
+
+        while True:
+            guess = rng.choice(guesses)
+            start = time.perf_counter()
+            writer.write(b"GUESS " + guess.encode("ascii") + b"\n")
+            await writer.drain()
+            reply = await reader.readline()
+            latencies.append(time.perf_counter() - start)
+            if not reply.startswith(b"RESULT") or not reply.rstrip().endswith(b"PLAYING"):
+                break
+
+    writer.write(b"QUIT\n")
+    await writer.drain()
+    writer.close()
+
+
+async def run(host, port, connections, games, seed, word_size = 5):
+    """
+    Run every player at once and return (latencies, elapsed seconds)
+    """
+    guesses = load_words("long_wordlist.txt", word_size)
+    latencies = []
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    await asyncio.gather(*[player(host, port, games, guesses, latencies, random.Random(rng.random()))
+        for i in range(connections)])
+    return latencies, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Load test the Wordle game server")
+    parser.add_argument("--host", default = "127.0.0.1")
+    parser.add_argument("--port", type = int, default = DEFAULT_PORT)
+    parser.add_argument("--connections", type = int, default = 1000, help = "concurrent games")
+    parser.add_argument("--games", type = int, default = 5, help = "games played by every connection")
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--word-size", type = int, default = 5, help = "word size the server was started with")
+    args = parser.parse_args()
+
+    latencies, elapsed = asyncio.run(run(args.host, args.port, args.connections, args.games, args.seed,
+        args.word_size))
+    latencies.sort()
+    print("Guesses:   " + str(len(latencies)) + " in " + str(round(elapsed, 2)) + " s ("
+        + str(round(len(latencies) / elapsed)) + " / s)")
+    for name, fraction in (("p50", 0.50), ("p90", 0.90), ("p99", 0.99), ("max", 1.0)):
+        print(name + ":       " + str(round(percentile(latencies, fraction) * 1000, 3)) + " ms")
@@ -0,0 +1,147 @@
+"""
+File: multiboard.py
+Authors: Wordle game contributors
+Date: 17 October 2026
+Description: Game rules for playing several boards at once with one keyboard
+(2 boards is Dordle, 4 is Quordle). Every guess is scored against the hidden
+words of all unsolved boards, and against the words each board could still be,
+in a single batched call.
+"""
+
+# Imports
+import numpy as np
+
+from batch_scoring import encode_words, score_batch
+from constraints import Constraints
+from scoring import decode, winning_pattern
+from session import GameSession
+
+
+class MultiBoardSession(GameSession):
+    __slots__ = ("NUM_BOARDS", "words", "answers", "short_matrix", "solved_rows", "candidates", "board_constraints")
+
+    def __init__(self, short_list, long_list, num_boards = 4, word_size = 5, num_guesses = None, rng = None,
+            sampler = None):
+        """
+        Create a session of num_boards boards. By default there are num_boards + 5
+        guesses, like Dordle (7) and Quordle (9).
+        """
+        if num_guesses == None:
+            num_guesses = num_boards + 5
+        GameSession.__init__(self, short_list, long_list, word_size, num_guesses, rng, sampler)
+        self.NUM_BOARDS = num_boards
+
+        self.words = []             # hidden word of every board
+        self.answers = None         # hidden words encoded for score_batch
+        self.short_matrix = encode_words(list(short_list), word_size)
+        self.solved_rows = [None] * num_boards  # row every board was solved on
+        self.candidates = []        # indexes into short_list of the words every board could still be
+        self.board_constraints = [Constraints(word_size) for i in range(num_boards)]
+
+    def start(self, words = None):
+        """
+        Start a game with the given hidden words, or different random ones from the
+        short list. Returns an error message, or None if the game started.
+        """
+        if self.game_started == True:
+            return "Game already started"
+
+        if words == None:
+            count = len(self.short_list)
+            if count < self.NUM_BOARDS:
+                return "Not enough words for " + str(self.NUM_BOARDS) + " boards"
+            if self.sampler != None:
+                # Weighted draws, repeated until every board has a different word
+                indexes = []
+                while len(indexes) < self.NUM_BOARDS:
+                    index = self.sampler.sample(self.random)
+                    if index not in indexes:
+                        indexes.append(index)
+            else:
+                indexes = self.random.sample(range(count), self.NUM_BOARDS)
+            words = [self.short_list[i] for i in indexes]
+        else:
+            words = [word.lower() for word in words]
+            if len(words) != self.NUM_BOARDS:
+                return "Specify " + str(self.NUM_BOARDS) + " words"
+            for word in words:
+                if len(word) != self.WORD_SIZE:
+                    return "Incorrect specified word length"
+                elif not (word.isascii() and word.isalpha()):
+                    return "Specified word must only contain letters"
+                elif self.guesses_must_be_words == True and word not in self.short_list:
+                    return "Specified word not a valid word"
+
+        self.words = words
+        self.word = " ".join(words)
+        self.answers = encode_words(words, self.WORD_SIZE)
+        self.candidates = [np.arange(len(self.short_list))] * self.NUM_BOARDS
+        self.game_started = True
+        return None
+
+    def unsolved_boards(self):
+        """
+        Numbers of the boards whose word has not been guessed yet
+        """
+        return [b for b in range(self.NUM_BOARDS) if self.solved_rows[b] == None]
+
+    def remaining(self, board):
+        """
+        Words from the short list that a board's hidden word could still be
+        """
+        return [self.short_list[i] for i in self.candidates[board].tolist()]
+
+    def submit(self):
+        """
+        Submit the current row. Returns a message for the player, or None.
+        When the row is accepted, the last entry of history is (guess, patterns)
+        with one pattern per board, or None for boards solved before this guess.
+        """
+        if not self.is_playing():
+            return None
+        if self.guess_column != self.WORD_SIZE + 1:
+            return "Word not finished"
+
+        guess = self.full_guess
+        if self.guesses_must_be_words == True and guess not in self.long_list:
+            return guess + " is not in the word list"
+        unsolved = self.unsolved_boards()
+        if self.hard_mode == True:
+            for b in unsolved:
+                error = self.board_constraints[b].check_hard_mode(guess)
+                if error != None:
+                    return "Board " + str(b + 1) + ": " + error
+
+        # Score the hidden words and every word still possible on any board together
+        possible = np.unique(np.concatenate([self.candidates[b] for b in unsolved]))
+        scored = score_batch(guess, np.concatenate((self.answers[unsolved], self.short_matrix[possible])))
+        board_patterns = scored[:len(unsolved)].tolist()
+        possible_patterns = scored[len(unsolved):]
+
+        patterns = [None] * self.NUM_BOARDS
+        for b, pattern in zip(unsolved, board_patterns):
+            patterns[b] = pattern
+            candidates = self.candidates[b]
+            self.candidates[b] = candidates[possible_patterns[np.searchsorted(possible, candidates)] == pattern]
+            self.board_constraints[b].update(guess, pattern)
+
+            colors = decode(pattern, self.WORD_SIZE)
+            for i in range(self.WORD_SIZE):
+                if colors[i] > self.letter_colors.get(guess[i], -1):
+                    self.letter_colors[guess[i]] = colors[i]
+            if pattern == winning_pattern(self.WORD_SIZE):
+                self.solved_rows[b] = self.guess_row
+
+        self.history.append((guess, patterns))
+        self.guess_row += 1
+        self.guess_column = 1
+        self.full_guess = ""
+
+        if len(self.unsolved_boards()) == 0:
+            self.game_won = True
+            self.game_finished = True
+            return "Correct. Nice job. Game over"
+        if self.guess_row == self.NUM_GUESSES + 1:
+            self.game_finished = True
+            return "Guesses used up. \n" + "Words were " + ", ".join(self.words) + ". Game over."
+        return None
@@ -0,0 +1,160 @@
+"""
+File: opening_book.py
+Authors: Wordle game contributors
+Date: 17 October 2026
+Description: Opening book for the hint solver. Stores the best first guess and
+the best second guess for every pattern the first guess can get. The book is
+built offline across all cores with a process pool:
+
+    python opening_book.py [--workers N] [--word-size N]
+"""
+
+# Imports
+import argparse
+import os
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from pattern_matrix import load_pattern_matrix
+from wordlist_cache import atomic_write
+from solver import Solver
+
+# File layout: header followed by one uint32 guess row per first guess pattern
+MAGIC = b"WRDLBK01"
+HEADER_FORMAT = "<8s32sIII"     # magic, hash of the word files, word size, opener row, number of patterns
+NO_GUESS = 0xFFFFFFFF           # stored for patterns that no answer can give
+
+# Solver used by every worker process, built once per process by init_worker
+worker_solver = None
+
+
+def book_filename(word_size):
+    """
+    Default name of the book file for a word size
+    """
+    return "opening_book." + str(word_size) + ".bin"
+
+
+class OpeningBook:
+    def __init__(self, opener, second_guesses):
+        """
+        Create a book from the first guess and a list of second guesses indexed by pattern
+        """
+        self.opener = opener
+        self.second_guesses = second_guesses
+
+
+def init_worker(long_filename, short_filename, word_size, matrix_path):
+    """
+    Load the memory mapped pattern matrix once in every worker process
+    """
+    global worker_solver
+    worker_solver = Solver(load_pattern_matrix(long_filename, short_filename, word_size, matrix_path))
+
+
+def first_guess_entropies(start, end):
+    """
+    Entropy of guess rows start to end over every answer
+    """
+    return start, worker_solver.entropies(worker_solver.candidates, np.arange(start, end))
+
+
+def second_guess(opener_row, pattern):
+    """
+    Best second guess row after the opener got the given pattern, or NO_GUESS
+    """
+    solver = worker_solver
+    row = solver.patterns.matrix[opener_row]
+    candidates = np.flatnonzero(row == pattern)
+
+    # Same rules as Solver.rank_guesses: with two or fewer answers left, guess one of them
+    if len(candidates) == 0:
+        return pattern, NO_GUESS
+    if len(candidates) <= 2:
+        return pattern, int(solver.answer_rows[candidates[0]])
+
+    best, entropy = solver.rank(solver.entropies(candidates), candidates, 1)[0]
+    return pattern, solver.patterns.guess_index[best]
+
+
+def build_opening_book(long_filename, short_filename, word_size, workers = None,
+        matrix_path = None):
+    """
+    Build the book with a pool of worker processes and return (patterns, opener row, second rows)
+    """
+    patterns = load_pattern_matrix(long_filename, short_filename, word_size, matrix_path)
+    solver = Solver(patterns)
+    num_guesses = len(patterns.guesses)
+    num_patterns = 3 ** word_size
+    workers = workers or os.cpu_count()
+
+    with ProcessPoolExecutor(max_workers = workers, initializer = init_worker,
+            initargs = (long_filename, short_filename, word_size, matrix_path)) as pool:
+        # First guess: split the guess rows into a few chunks per worker
+        entropy = np.empty(num_guesses)
+        bounds = np.linspace(0, num_guesses, workers * 4 + 1, dtype = np.int64)
+        jobs = [pool.submit(first_guess_entropies, bounds[i], bounds[i + 1]) for i in range(len(bounds) - 1)]
+        for job in jobs:
+            start, chunk = job.result()
+            entropy[start:start + len(chunk)] = chunk
+
+        opener = solver.rank(entropy, solver.candidates, 1)[0][0]
+        opener_row = patterns.guess_index[opener]
+
+        # Second guess: one job for every pattern the opener can get
+        second_rows = [NO_GUESS] * num_patterns
+        possible_patterns = np.unique(patterns.matrix[opener_row])
+        for pattern, row in pool.map(second_guess, [opener_row] * len(possible_patterns),
+                [int(p) for p in possible_patterns]):
+            second_rows[pattern] = row
+
+    return patterns, opener_row, second_rows
+
+
+def write_opening_book(path, source_hash, word_size, opener_row, second_rows):
+    """
+    Write the book to path, replacing any old file in one step
+    """
+    atomic_write(path, [struct.pack(HEADER_FORMAT, MAGIC, source_hash, word_size, opener_row, len(second_rows)),
+        np.array(second_rows, dtype = "<u4").tobytes()])
+
+
+def load_opening_book(patterns, path = None):
+    """
+    Load the book for a PatternMatrix, or return None if there is no book
+    built from the same word files
+    """
+    word_size = len(patterns.guesses[0])
+    try:
+        with open(path or book_filename(word_size), "rb") as file:
+            data = file.read()
+    except OSError:
+        return None
+
+    header_size = struct.calcsize(HEADER_FORMAT)
+    if len(data) < header_size:
+        return None
+    magic, source_hash, word_size, opener_row, num_patterns = struct.unpack_from(HEADER_FORMAT, data)
+    if magic != MAGIC or source_hash != patterns.source_hash or len(data) != header_size + 4 * num_patterns:
+        return None
+
+    second_rows = np.frombuffer(data, dtype = "<u4", offset = header_size)
+    second_guesses = [None if row == NO_GUESS else patterns.guesses[row] for row in second_rows]
+    return OpeningBook(patterns.guesses[opener_row], second_guesses)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Build the Wordle opening book")
+    parser.add_argument("--workers", type = int, default = None, help = "number of worker processes")
+    parser.add_argument("--word-size", type = int, default = 5, choices = range(4, 11), metavar = "4-10")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    patterns, opener_row, second_rows = build_opening_book("long_wordlist.txt", "short_wordlist.txt",
+        args.word_size, args.workers)
+    write_opening_book(book_filename(args.word_size), patterns.source_hash, args.word_size, opener_row, second_rows)
+    print("Opener = " + patterns.guesses[opener_row])
+    print("Built in " + str(round(time.perf_counter() - start, 2)) + " seconds")
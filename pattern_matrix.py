@@ -0,0 +1,143 @@
+"""
+File: pattern_matrix.py
+Authors: Wordle game contributors
+Date: 17 October 2026
+Description: Precomputed matrix of the pattern of every long list guess against
+every short list answer, stored in a binary file that is loaded with a memory map
+so that many processes can share one copy. Patterns take one byte for words of up
+to 5 letters and two bytes for words of up to 10 letters.
+
+Run "python pattern_matrix.py [word size]" to build the file ahead of time.
+"""
+
+# Imports
+import hashlib
+import struct
+import sys
+
+import numpy as np
+
+from dictionary import WordDictionary
+from batch_scoring import encode_words, pattern_dtype, score_batch
+from wordlist_cache import atomic_write, load_words
+
+# File layout: a fixed size header followed by a rows x columns pattern matrix
+MAGIC = b"WRDLPAT1"
+HEADER_FORMAT = "<8s32sIII"     # magic, hash of the word files, word size, rows, columns
+HEADER_SIZE = 64                # header is padded so the matrix starts aligned
+
+
+def matrix_filename(word_size):
+    """
+    Default name of the matrix file for a word size
+    """
+    return "patterns." + str(word_size) + ".bin"
+
+
+def wordlist_hash(filenames, word_size):
+    """
+    Hash the contents of the word files together with the word size
+    """
+    digest = hashlib.sha256(str(word_size).encode())
+    for filename in filenames:
+        with open(filename, "rb") as file:
+            digest.update(hashlib.sha256(file.read()).digest())
+    return digest.digest()
+
+
+def build_matrix(guesses, answers):
+    """
+    Score every guess against every answer and return the pattern matrix
+    """
+    word_size = len(guesses[0])
+    encoded_answers = encode_words(list(answers), word_size)
+    matrix = np.empty((len(guesses), len(answers)), dtype = pattern_dtype(word_size))
+    for r in range(len(guesses)):
+        matrix[r] = score_batch(guesses[r], encoded_answers)
+    return matrix
+
+
+def write_matrix(path, matrix, source_hash, word_size):
+    """
+    Write the matrix and its header to path, replacing any old file in one step
+    """
+    header = struct.pack(HEADER_FORMAT, MAGIC, source_hash, word_size, matrix.shape[0], matrix.shape[1])
+    atomic_write(path, [header.ljust(HEADER_SIZE, b"\0"), np.ascontiguousarray(matrix).tobytes()])
+
+
+def read_header(path):
+    """
+    Return (source hash, word size, rows, columns) of a matrix file, or None if
+    the file is missing or is not a matrix file
+    """
+    try:
+        with open(path, "rb") as file:
+            header = file.read(HEADER_SIZE)
+    except OSError:
+        return None
+
+    if len(header) != HEADER_SIZE:
+        return None
+    magic, source_hash, word_size, rows, columns = struct.unpack_from(HEADER_FORMAT, header)
+    if magic != MAGIC:
+        return None
+    return source_hash, word_size, rows, columns
+
+
+class PatternMatrix:
+    def __init__(self, guesses, answers, matrix, source_hash = None):
+        """
+        Wrap a matrix whose rows are the guesses and columns are the answers
+        """
+        self.guesses = guesses
+        self.answers = answers
+        self.matrix = matrix
+        self.source_hash = source_hash  # hash of the word files the matrix was built from
+
+        # Map every word to its row or column in the matrix
+        self.guess_index = {guesses[i]: i for i in range(len(guesses))}
+        self.answer_index = {answers[i]: i for i in range(len(answers))}
+
+    def pattern(self, guess, answer):
+        """
+        Look up the pattern of a guess against an answer
+        """
+        return int(self.matrix[self.guess_index[guess], self.answer_index[answer]])
+
+    def row(self, guess):
+        """
+        Patterns of a guess against every answer
+        """
+        return self.matrix[self.guess_index[guess]]
+
+
+def load_pattern_matrix(long_filename, short_filename, word_size, path = None):
+    """
+    Load the pattern matrix for the given word files, building it first if
+    the file is missing or was built from different word files
+    """
+    # Patterns are stored in at most two bytes, which fits up to 3 ** 10 patterns
+    if 3 ** word_size > 65536:
+        raise ValueError("pattern matrix only supports words of up to 10 letters")
+
+    path = path or matrix_filename(word_size)
+    guesses = WordDictionary(load_words(long_filename, word_size))
+    answers = WordDictionary(load_words(short_filename, word_size))
+    if len(guesses) == 0 or len(answers) == 0:
+        raise ValueError("no words of " + str(word_size) + " letters")
+    source_hash = wordlist_hash([long_filename, short_filename], word_size)
+
+    header = read_header(path)
+    if header != (source_hash, word_size, len(guesses), len(answers)):
+        write_matrix(path, build_matrix(guesses, answers), source_hash, word_size)
+
+    matrix = np.memmap(path, dtype = pattern_dtype(word_size), mode = "r", offset = HEADER_SIZE,
+        shape = (len(guesses), len(answers)))
+    return PatternMatrix(guesses, answers, matrix, source_hash)
+
+
+if __name__ == "__main__":
+    word_size = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    patterns = load_pattern_matrix("long_wordlist.txt", "short_wordlist.txt", word_size)
+    print("Pattern matrix: " + str(patterns.matrix.shape[0]) + " guesses x "
+        + str(patterns.matrix.shape[1]) + " answers")
@@ -0,0 +1,148 @@
+"""
+File: profiling.py
+Authors: Wordle game contributors
+Date: 17 October 2026
+Description: Opt-in timing of the game's hot paths. Turned on with the
+WORDLE_PROFILE environment variable or the --profile flag of wordle-final.py:
+
+    WORDLE_PROFILE=1                print timing histograms on exit
+    WORDLE_PROFILE=trace.json       also write a Chrome trace (chrome://tracing)
+    WORDLE_PROFILE=wordle.pstats    also write a cProfile file (python -m pstats)
+
+When profiling is off nothing is wrapped, so it costs nothing.
+"""
+
+# Imports
+import os
+import sys
+import time
+
+NUM_BUCKETS = 32            # histogram bucket i counts calls of 2 ** (i - 1) to 2 ** i microseconds
+MAX_TRACE_EVENTS = 200000   # Chrome trace events kept; later calls are only counted
+
+
+class Histogram:
+    __slots__ = ("count", "total", "largest", "buckets")
+
+    def __init__(self):
+        """
+        Create an empty histogram of call durations
+        """
+        self.count = 0
+        self.total = 0.0
+        self.largest = 0.0
+        self.buckets = [0] * NUM_BUCKETS
+
+    def add(self, seconds):
+        """
+        Add one call duration
+        """
+        self.count += 1
+        self.total += seconds
+        if seconds > self.largest:
+            self.largest = seconds
+        self.buckets[min(NUM_BUCKETS - 1, int(seconds * 1000000).bit_length())] += 1
+
+    def percentile(self, fraction):
+        """
+        Upper bound, in seconds, of the bucket holding the given fraction of calls
+        """
+        target = fraction * self.count
+        seen = 0
+        for i in range(NUM_BUCKETS):
+            seen += self.buckets[i]
+            if seen >= target:
+                return min(self.largest, (1 << i) / 1000000)
+        return self.largest
+
+
+class Profiler:
+    def __init__(self, output = None):
+        """
+        Create a profiler that writes a Chrome trace (.json) or cProfile file
+        (any other name) to output when it finishes, if output is given
+        """
+        self.output = output
+        self.histograms = {}
+        self.trace_events = None
+        self.cprofile = None
+        self.start_time = time.perf_counter()
+
+        if output != None and output.endswith(".json"):
+            self.trace_events = []
+        elif output != None:
+            # cProfile and json are only imported when their output file is asked for
+            import cProfile
+            self.cprofile = cProfile.Profile()
+            self.cprofile.enable()
+
+    def wrap(self, name, function):
+        """
+        Return a version of function that records how long every call takes
+        """
+        histogram = self.histograms.setdefault(name, Histogram())
+        trace_events = self.trace_events
+        start_time = self.start_time
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                end = time.perf_counter()
+                histogram.add(end - start)
+                if trace_events != None and len(trace_events) < MAX_TRACE_EVENTS:
+                    trace_events.append((name, start - start_time, end - start))
+        return timed
+
+    def instrument(self, obj, names):
+        """
+        Replace methods of an object with timed versions
+        """
+        for name in names:
+            setattr(obj, name, self.wrap(name, getattr(obj, name)))
+
+    def report(self):
+        """
+        Text table of every histogram
+        """
+        lines = ["{:<24}{:>8}{:>12}{:>12}{:>12}{:>12}".format("name", "calls", "mean ms", "p50 ms", "p99 ms", "max ms")]
+        for name in sorted(self.histograms):
+            histogram = self.histograms[name]
+            if histogram.count == 0:
+                continue
+            lines.append("{:<24}{:>8}{:>12.3f}{:>12.3f}{:>12.3f}{:>12.3f}".format(name, histogram.count,
+                histogram.total / histogram.count * 1000, histogram.percentile(0.5) * 1000,
+                histogram.percentile(0.99) * 1000, histogram.largest * 1000))
+        return "\n".join(lines)
+
+    def finish(self):
+        """
+        Print the histograms and write the output file, if any
+        """
+        print(self.report(), file = sys.stderr)
+
+        if self.cprofile != None:
+            self.cprofile.disable()
+            self.cprofile.dump_stats(self.output)
+        elif self.trace_events != None:
+            import json
+            events = [{"name": name, "ph": "X", "pid": os.getpid(), "tid": 0,
+                "ts": round(start * 1000000, 3), "dur": round(duration * 1000000, 3)}
+                for name, start, duration in self.trace_events]
+            with open(self.output, "w") as file:
+                json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+
+
+def profiler_from_settings(setting = None):
+    """
+    Return a Profiler if profiling was asked for by the given setting or the
+    WORDLE_PROFILE environment variable, or None if it is off
+    """
+    if setting == None:
+        setting = os.environ.get("WORDLE_PROFILE", "")
+    if setting in ("", "0"):
+        return None
+    if setting == "1":
+        return Profiler()
+    return Profiler(setting)
@@ -0,0 +1,93 @@
+"""
+File: render.py
+Authors: Wordle game contributors
+Date: 17 October 2026
+Description: Batched widget updates. Callers describe the options each widget
+should end up with; once per pass of the Tk event loop the renderer sends a
+single configure call per widget, holding only the options that changed.
+"""
+
+
+class Renderer:
+    def __init__(self, window):
+        """
+        Create a renderer that schedules its updates on the given Tk window
+        """
+        self.window = window
+        self.applied = {}       # widget -> options the widget is known to have
+        self.pending = {}       # widget -> options to apply on the next flush
+        self.scheduled = False
+        self.configure_calls = 0    # number of configure calls sent to Tk
+
+    def track(self, widget, **options):
+        """
+        Record options a widget was created with, so setting them again costs nothing
+        """
+        self.applied.setdefault(widget, {}).update(options)
+
+    def set(self, widget, **options):
+        """
+        Ask for a widget to have these options after the next flush
+        """
+        self.pending.setdefault(widget, {}).update(options)
+        if self.scheduled == False:
+            self.scheduled = True
+            self.window.after_idle(self.flush)
+
+    def flush(self):
+        """
+        Apply every pending change, one configure call per widget that changed
+        """
+        self.scheduled = False
+        pending = self.pending
+        self.pending = {}
+
+        for widget, options in pending.items():
+            applied = self.applied.setdefault(widget, {})
+            changed = {}
+            for name, value in options.items():
+                if applied.get(name) != value:
+                    changed[name] = value
+            if changed:
+                widget.configure(**changed)
+                applied.update(changed)
+                self.configure_calls += 1
+
+    def forget(self, widgets):
+        """
+        Drop everything known about widgets that have been destroyed
+        """
+        for widget in widgets:
+            self.applied.pop(widget, None)
+            self.pending.pop(widget, None)
+
+
+class CanvasTile:
+    """
+    A guess box drawn as a square and a letter on a Canvas, so a board costs one
+    widget instead of two per box. It is configured like a widget, so the renderer
+    can batch it: bg is the color of the square, fg and text are the letter's.
+    """
+    __slots__ = ("canvas", "square", "letter")
+
+    def __init__(self, canvas, x, y, size, font, bg, fg):
+        """
+        Draw an empty box with its top left corner at (x, y)
+        """
+        self.canvas = canvas
+        self.square = canvas.create_rectangle(x, y, x + size, y + size, fill = bg, outline = 'black')
+        self.letter = canvas.create_text(x + size / 2, y + size / 2, text = "", fill = fg, font = font)
+
+    def configure(self, bg = None, fg = None, text = None):
+        """
+        Change the given options of the square and the letter
+        """
+        if bg != None:
+            self.canvas.itemconfigure(self.square, fill = bg)
+        options = {}
+        if fg != None:
+            options["fill"] = fg
+        if text != None:
+            options["text"] = text
+        if options:
+            self.canvas.itemconfigure(self.letter, **options)
@@ -0,0 +1,74 @@
+"""
+File: scoring.py
+Authors: Wordle game contributors
+Date: 17 October 2026
+Description: Headless scoring of Wordle guesses. A pattern is an integer
+where the color of letter i is stored as the i-th base 3 digit.
+"""
+
+# Colors of a single letter in a pattern
+GRAY = 0    # letter is not in the hidden word
+ORANGE = 1  # letter is in the hidden word but in the wrong location
+GREEN = 2   # letter is in the hidden word and in the correct location
+
+# Powers of 3 for every letter position (words longer than this are not supported)
+MAX_WORD_SIZE = 16
+POWERS_OF_3 = tuple(3 ** i for i in range(MAX_WORD_SIZE))
+
+ORD_A = ord('a')
+
+
+def score(guess, answer):
+    """
+    Score a lowercase guess against a lowercase answer of the same length
+    and return the pattern
+    """
+    counts = [0] * 26
+    pattern = 0
+
+    # First pass: greens, and count answer letters that were not matched
+    for i in range(len(answer)):
+        letter = answer[i]
+        if guess[i] == letter:
+            pattern += GREEN * POWERS_OF_3[i]
+        else:
+            counts[ord(letter) - ORD_A] += 1
+
+    # Second pass: oranges, using up the unmatched answer letters left to right
+    for i in range(len(answer)):
+        letter = guess[i]
+        if letter != answer[i]:
+            index = ord(letter) - ORD_A
+            if counts[index] > 0:
+                counts[index] -= 1
+                pattern += ORANGE * POWERS_OF_3[i]
+
+    return pattern
+
+
+def encode(colors):
+    """
+    Turn a list of colors (GRAY, ORANGE, GREEN) into a pattern
+    """
+    pattern = 0
+    for i in range(len(colors)):
+        pattern += colors[i] * POWERS_OF_3[i]
+    return pattern
+
+
+def decode(pattern, size):
+    """
+    Turn a pattern back into a list of colors for a word of the given size
+    """
+    colors = []
+    for i in range(size):
+        colors.append(pattern % 3)
+        pattern //= 3
+    return colors
+
+
+def winning_pattern(size):
+    """
+    Pattern of a guess that is entirely green
+    """
+    return 3 ** size - 1
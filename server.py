@@ -0,0 +1,197 @@
+"""
+File: server.py
+Authors: Wordle game contributors
+Date: 17 October 2026
+Description: asyncio Wordle server. Every connection plays its own GameSession,
+and all sessions share one read-only copy of the word lists.
+
+    python server.py [--host HOST] [--port PORT] [--word-size N]
+
+Saved games are encrypted and signed with a key of the server, so players can
+neither read the hidden word from them nor change them. The key is random for
+every run unless WORDLE_SERVER_SECRET is set; set it to the same value on every
+server that should accept the games saved by the others.
+
+Line protocol (one command per line, one reply line per command):
+    NEW [WORD]      start a new game, with a random or the given hidden word
+    DAILY [NUMBER]  start today's puzzle, or the puzzle with the given number
+    GUESS WORD      submit a guess
+    SAVE            get the game as a sealed hex string, to resume it later or elsewhere
+    LOAD HEX        resume a game saved with SAVE
+    QUIT            close the connection
+
+Replies:
+    OK                              game started
+    STATE <hex>                     saved game
+    RESULT <colors> PLAYING|WON     guess accepted; colors has one digit per
+    RESULT <colors> LOST <word>     letter (0 = gray, 1 = orange, 2 = green)
+    ERR <message>                   command rejected
+"""
+
+# Imports
+import argparse
+import asyncio
+import hashlib
+import hmac
+import os
+
+from daily import puzzle_number, puzzle_word
+from scoring import decode
+from session import GameSession
+from snapshot import capture, state_from_bytes
+from wordlist_cache import load_dictionary
+
+DEFAULT_PORT = 7777
+NONCE_SIZE = 16
+TAG_SIZE = 32
+
+# Key that seals saved games; random unless given, so they only load on this server
+SECRET_ENV = "WORDLE_SERVER_SECRET"
+SECRET = os.environ[SECRET_ENV].encode("utf-8") if os.environ.get(SECRET_ENV) else os.urandom(32)
+
+
+def keystream(secret, nonce, length):
+    """
+    Bytes to mask a saved game with, from HMAC-SHA256 of the nonce and a counter
+    """
+    blocks = []
+    for counter in range((length + 31) // 32):
+        blocks.append(hmac.digest(secret, b"mask" + nonce + counter.to_bytes(4, "little"), hashlib.sha256))
+    return b"".join(blocks)[:length]
+
+
+def seal(data, secret):
+    """
+    Encrypt a saved game and append its HMAC, so it can be handed to a player
+    """
+    nonce = os.urandom(NONCE_SIZE)
+    masked = bytes(a ^ b for a, b in zip(data, keystream(secret, nonce, len(data))))
+    return nonce + masked + hmac.digest(secret, b"sign" + nonce + masked, hashlib.sha256)
+
+
+def unseal(data, secret):
+    """
+    Check and decrypt a saved game sealed by seal. Raises ValueError if it
+    was not sealed with this secret or has been changed.
+    """
+    if len(data) < NONCE_SIZE + TAG_SIZE:
+        raise ValueError("Not a saved game")
+    nonce = data[:NONCE_SIZE]
+    masked = data[NONCE_SIZE:-TAG_SIZE]
+    if not hmac.compare_digest(data[-TAG_SIZE:], hmac.digest(secret, b"sign" + nonce + masked, hashlib.sha256)):
+        raise ValueError("Not a saved game")
+    return bytes(a ^ b for a, b in zip(masked, keystream(secret, nonce, len(masked))))
+
+
+def handle_command(line, session, short_list, long_list, word_size = 5, secret = SECRET):
+    """
+    Run one command and return (reply, session). The session is replaced by
+    NEW, DAILY and LOAD. Saved games are sealed with secret.
+    """
+    parts = line.split()
+    if len(parts) == 0:
+        return "ERR Empty command", session
+    command = parts[0].upper()
+
+    if command == "NEW" and len(parts) <= 2:
+        new_session = GameSession(short_list, long_list, word_size)
+        error = new_session.start(parts[1] if len(parts) == 2 else None)
+        if error != None:
+            return "ERR " + error, session
+        return "OK", new_session
+
+    if command == "DAILY" and len(parts) <= 2:
+        if len(parts) == 2 and not parts[1].isdigit():
+            return "ERR Puzzle number must be a number", session
+        number = int(parts[1]) if len(parts) == 2 else puzzle_number()
+        word = puzzle_word("short_wordlist.txt", word_size, number)
+        if word == None:
+            return "ERR No puzzles of this word size", session
+        new_session = GameSession(short_list, long_list, word_size)
+        new_session.start(word)
+        return "OK " + str(number), new_session
+
+    if command == "GUESS" and len(parts) == 2:
+        if session == None or not session.is_playing():
+            return "ERR No game in progress", session
+
+        guesses_made = len(session.history)
+        message = session.enter_word(parts[1])
+        if len(session.history) == guesses_made:
+            return "ERR " + message, session
+
+        guess, pattern = session.history[-1]
+        colors = "".join(str(color) for color in decode(pattern, session.WORD_SIZE))
+        if session.game_won:
+            return "RESULT " + colors + " WON", session
+        if session.game_finished:
+            return "RESULT " + colors + " LOST " + session.word, session
+        return "RESULT " + colors + " PLAYING", session
+
+    if command == "SAVE" and len(parts) == 1:
+        if session == None:
+            return "ERR No game in progress", session
+        return "STATE " + seal(capture(session).to_bytes(), secret).hex(), session
+
+    if command == "LOAD" and len(parts) == 2:
+        try:
+            state = state_from_bytes(unseal(bytes.fromhex(parts[1]), secret))
+            if state.WORD_SIZE != word_size:
+                return "ERR Saved game has a different word size", session
+            return "OK", state.restore(short_list, long_list)
+        except ValueError:
+            return "ERR Not a saved game", session
+
+    return "ERR Unknown command", session
+
+
+async def handle_client(reader, writer, short_list, long_list, word_size):
+    """
+    Serve one connection until it sends QUIT or closes
+    """
+    session = None
+    try:
+        while True:
+            line = await reader.readline()
+            if line == b"":
+                break
+            line = line.decode("ascii", "replace")
+            if line.strip().upper() == "QUIT":
+                break
+
+            reply, session = handle_command(line, session, short_list, long_list, word_size)
+            writer.write(reply.encode("ascii", "replace") + b"\n")
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(host, port, short_list, long_list, word_size):
+    """
+    Accept connections until the server is stopped
+    """
+    async def client_connected(reader, writer):
+        await handle_client(reader, writer, short_list, long_list, word_size)
+
+    server = await asyncio.start_server(client_connected, host, port, backlog = 4096)
+    print("Serving Wordle on " + host + ":" + str(port))
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Run the Wordle game server")
+    parser.add_argument("--host", default = "127.0.0.1")
+    parser.add_argument("--port", type = int, default = DEFAULT_PORT)
+    parser.add_argument("--word-size", type = int, default = 5, choices = range(4, 11), metavar = "4-10")
+    args = parser.parse_args()
+
+    # Word lists are loaded once and shared by every session
+    short_list = load_dictionary("short_wordlist.txt", args.word_size)
+    long_list = load_dictionary("long_wordlist.txt", args.word_size)
+    try:
+        asyncio.run(serve(args.host, args.port, short_list, long_list, args.word_size))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,167 @@
+"""
+File: session.py
+Authors: Wordle game contributors
+Date: 17 October 2026
+Description: Game rules of Wordle without any user interface. The Tk window and
+the terminal front end are both clients of a GameSession.
+"""
+
+# Imports
+import random
+
+from constraints import Constraints
+from scoring import score, decode, winning_pattern
+
+
+class GameSession:
+    # Sessions are kept small so a server can hold many of them at once
+    __slots__ = ("short_list", "long_list", "WORD_SIZE", "NUM_GUESSES", "random",
+        "guesses_must_be_words", "word", "game_started", "game_finished", "game_won",
+        "guess_row", "guess_column", "full_guess", "history", "letter_colors", "hard_mode", "constraints",
+        "sampler")
+
+    def __init__(self, short_list, long_list, word_size = 5, num_guesses = 6, rng = None, sampler = None):
+        """
+        Create a session that picks answers from short_list and accepts guesses from long_list.
+        If a sampler (frequency.AliasSampler) is given, common answers are picked more often.
+        """
+        self.short_list = short_list
+        self.long_list = long_list
+        self.WORD_SIZE = word_size
+        self.NUM_GUESSES = num_guesses
+        self.random = rng or random
+        self.sampler = sampler
+
+        self.guesses_must_be_words = True   # checked for the specified word and every guess
+        self.hard_mode = False              # revealed hints must be used in later guesses
+        self.word = ""
+        self.game_started = False
+        self.game_finished = False
+        self.game_won = False
+
+        self.guess_row = 1      # row being typed, from 1 to NUM_GUESSES
+        self.guess_column = 1   # column the next letter goes in, from 1 to WORD_SIZE + 1
+        self.full_guess = ""    # letters typed in the current row
+        self.history = []       # (guess, pattern) for every submitted row
+        self.letter_colors = {} # best color seen so far for every guessed letter
+        self.constraints = Constraints(word_size)   # what the guesses so far revealed
+
+    def start(self, word = None):
+        """
+        Start a game with the given hidden word, or a random one from the short list.
+        Returns an error message, or None if the game started.
+        """
+        if self.game_started == True:
+            return "Game already started"
+
+        if word == None:
+            if self.sampler != None:
+                word = self.short_list[self.sampler.sample(self.random)]
+            else:
+                word = self.random.choice(self.short_list)
+        else:
+            word = word.lower()
+
+            # Check the specified word is the right length and only has letters
+            if len(word) != self.WORD_SIZE:
+                return "Incorrect specified word length"
+            elif not (word.isascii() and word.isalpha()):
+                return "Specified word must only contain letters"
+            elif self.guesses_must_be_words == True and word not in self.short_list:
+                return "Specified word not a valid word"
+
+        self.word = word
+        self.game_started = True
+        return None
+
+    def is_playing(self):
+        """
+        Check if the game accepts input
+        """
+        return self.game_started == True and self.game_finished == False
+
+    def type_letter(self, letter):
+        """
+        Add a letter to the current row. Returns True if the letter was added.
+        """
+        if not self.is_playing() or self.guess_column == self.WORD_SIZE + 1:
+            return False
+        if len(letter) != 1 or not ('a' <= letter.lower() <= 'z'):
+            return False
+        self.full_guess += letter.lower()
+        self.guess_column += 1
+        return True
+
+    def backspace(self):
+        """
+        Remove the last letter of the current row. Returns True if a letter was removed.
+        """
+        if not self.is_playing() or self.guess_column == 1:
+            return False
+        self.full_guess = self.full_guess[:-1]
+        self.guess_column -= 1
+        return True
+
+    def enter_word(self, word):
+        """
+        Clear the current row, type a whole word into it and submit it.
+        Returns the message from submit.
+        """
+        if self.is_playing() and len(word) > self.WORD_SIZE:
+            return "Word too long"
+        while self.backspace():
+            pass
+        for letter in word:
+            self.type_letter(letter)
+        return self.submit()
+
+    def score_guess(self, guess):
+        """
+        Pattern of an accepted guess against the hidden word
+        """
+        return score(guess, self.word)
+
+    def submit(self):
+        """
+        Submit the current row. Returns a message for the player, or None.
+        When the row is accepted, its pattern is the last entry of history.
+        """
+        if not self.is_playing():
+            return None
+        if self.guess_column != self.WORD_SIZE + 1:
+            return "Word not finished"
+
+        guess = self.full_guess
+        if self.guesses_must_be_words == True and guess not in self.long_list:
+            return guess + " is not in the word list"
+        if self.hard_mode == True:
+            error = self.constraints.check_hard_mode(guess)
+            if error != None:
+                return error
+
+        return self.apply_guess(guess, self.score_guess(guess))
+
+    def apply_guess(self, guess, pattern):
+        """
+        Record a scored guess and move onto the next row. Returns a message for
+        the player, or None. Also used to replay the guesses of a restored game.
+        """
+        self.history.append((guess, pattern))
+        self.constraints.update(guess, pattern)
+        colors = decode(pattern, self.WORD_SIZE)
+        for i in range(self.WORD_SIZE):
+            if colors[i] > self.letter_colors.get(guess[i], -1):
+                self.letter_colors[guess[i]] = colors[i]
+
+        self.guess_row += 1
+        self.guess_column = 1
+        self.full_guess = ""
+
+        if pattern == winning_pattern(self.WORD_SIZE):
+            self.game_won = True
+            self.game_finished = True
+            return "Correct. Nice job. Game over"
+        if self.guess_row == self.NUM_GUESSES + 1:
+            self.game_finished = True
+            return "Guesses used up. \n" + "Word was " + self.word + ". Game over."
+        return None
@@ -0,0 +1,224 @@
+"""
+File: simulate.py
+Authors: Wordle game contributors
+Date: 17 October 2026
+Description: Monte-Carlo benchmark that plays whole games headlessly with a
+guessing strategy, spread over a process pool, and writes the results as JSON.
+
+    python simulate.py [--strategy random|greedy|entropy] [--games N] [--seed N]
+                       [--word-size N] [--workers N] [--output results.json]
+"""
+
+# Imports
+import argparse
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from session import GameSession
+from wordlist_cache import load_dictionary
+
+LONG_WORDLIST_FILENAME = "long_wordlist.txt"
+SHORT_WORDLIST_FILENAME = "short_wordlist.txt"
+DEFAULT_WORD_SIZE = 5
+NUM_GUESSES = 6
+
+
+class RandomStrategy:
+    """
+    Guess any random valid word
+    """
+    def __init__(self, short_list, long_list, rng, word_size):
+        """
+        Create the strategy with its own random number generator
+        """
+        self.long_list = long_list
+        self.random = rng
+
+    def reset(self):
+        """
+        Start a new game
+        """
+        pass
+
+    def next_guess(self):
+        """
+        Choose the next guess
+        """
+        return self.random.choice(self.long_list)
+
+    def update(self, guess, pattern):
+        """
+        Learn the pattern a guess got
+        """
+        pass
+
+
+class SolverStrategy:
+    """
+    Base for strategies that keep the answers consistent with the guesses so far
+    """
+    def __init__(self, short_list, long_list, rng, word_size):
+        """
+        Create the solver, starting from the opening book when there is one
+        """
+        # NumPy is only needed by these strategies, so it is imported here
+        from solver import Solver
+
+        patterns, book = open_pattern_matrix(word_size)
+        self.solver = Solver(patterns, book)
+        self.random = rng
+
+    def reset(self):
+        """
+        Start a new game
+        """
+        self.solver.reset()
+
+    def update(self, guess, pattern):
+        """
+        Narrow the possible answers with the pattern a guess got
+        """
+        self.solver.update(guess, pattern)
+
+
+class GreedyStrategy(SolverStrategy):
+    """
+    Guess a random answer that is still possible
+    """
+    def next_guess(self):
+        """
+        Choose a random possible answer
+        """
+        remaining = self.solver.remaining()
+        return self.random.choice(remaining) if remaining else self.random.choice(self.solver.patterns.guesses)
+
+
+class EntropyStrategy(SolverStrategy):
+    """
+    Guess the word that gives the most information
+    """
+    def next_guess(self):
+        """
+        Choose the best guess of the solver
+        """
+        return self.solver.best_guess() or self.random.choice(self.solver.patterns.guesses)
+
+
+STRATEGIES = {"random": RandomStrategy, "greedy": GreedyStrategy, "entropy": EntropyStrategy}
+
+# Word lists used by every worker process, loaded once by init_worker
+worker_lists = None
+# Pattern matrix and opening book opened in this process, by word size
+open_matrices = {}
+
+
+def open_pattern_matrix(word_size):
+    """
+    Return (pattern matrix, opening book), opening them once per process. The
+    first call builds the matrix if it is missing, so simulate makes it in the
+    parent before any worker starts.
+    """
+    if word_size not in open_matrices:
+        from pattern_matrix import load_pattern_matrix
+        from opening_book import load_opening_book
+
+        patterns = load_pattern_matrix(LONG_WORDLIST_FILENAME, SHORT_WORDLIST_FILENAME, word_size)
+        open_matrices[word_size] = (patterns, load_opening_book(patterns))
+    return open_matrices[word_size]
+
+
+def init_worker(strategy_name, word_size):
+    """
+    Load the word lists, and open the pattern matrix if the strategy uses one,
+    once in every worker process
+    """
+    global worker_lists
+    worker_lists = (load_dictionary(SHORT_WORDLIST_FILENAME, word_size),
+        load_dictionary(LONG_WORDLIST_FILENAME, word_size))
+    if issubclass(STRATEGIES[strategy_name], SolverStrategy):
+        open_pattern_matrix(word_size)
+
+
+def play_games(strategy_name, games, seed, word_size):
+    """
+    Play a number of games with one seed and return the number of guesses of
+    every game (0 for a lost game)
+    """
+    short_list, long_list = worker_lists
+    rng = random.Random(seed)
+    strategy = STRATEGIES[strategy_name](short_list, long_list, rng, word_size)
+
+    results = []
+    for game in range(games):
+        session = GameSession(short_list, long_list, word_size, NUM_GUESSES, rng)
+        session.start()
+        strategy.reset()
+        while session.is_playing():
+            session.enter_word(strategy.next_guess())
+            strategy.update(*session.history[-1])
+        results.append(len(session.history) if session.game_won else 0)
+    return results
+
+
+def simulate(strategy_name, games, seed, workers = None, chunk_size = 200, word_size = DEFAULT_WORD_SIZE):
+    """
+    Play games across a process pool and return a summary dictionary
+    """
+    workers = workers or os.cpu_count()
+    chunks = [min(chunk_size, games - start) for start in range(0, games, chunk_size)]
+    if len(load_dictionary(SHORT_WORDLIST_FILENAME, word_size)) == 0:
+        raise ValueError("no words of " + str(word_size) + " letters")
+
+    # Build or check the pattern matrix here, so the workers only have to open it
+    if issubclass(STRATEGIES[strategy_name], SolverStrategy):
+        open_pattern_matrix(word_size)
+
+    start_time = time.perf_counter()
+    with ProcessPoolExecutor(max_workers = workers, initializer = init_worker,
+            initargs = (strategy_name, word_size)) as pool:
+        # Every chunk gets its own seed so results do not depend on the number of workers
+        results = []
+        for chunk_results in pool.map(play_games, [strategy_name] * len(chunks), chunks,
+                [seed * 1000003 + i for i in range(len(chunks))], [word_size] * len(chunks)):
+            results.extend(chunk_results)
+    elapsed = time.perf_counter() - start_time
+
+    distribution = {str(i): 0 for i in range(1, NUM_GUESSES + 1)}
+    distribution["X"] = 0
+    for guesses in results:
+        distribution[str(guesses) if guesses > 0 else "X"] += 1
+    wins = games - distribution["X"]
+
+    return {
+        "strategy": strategy_name,
+        "games": games,
+        "seed": seed,
+        "word_size": word_size,
+        "workers": workers,
+        "seconds": round(elapsed, 3),
+        "games_per_sec": round(games / elapsed, 1),
+        "win_rate": round(wins / games, 4) if games else 0.0,
+        "mean_guesses_when_won": round(sum(results) / wins, 3) if wins else 0.0,
+        "guess_distribution": distribution,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Benchmark whole Wordle games")
+    parser.add_argument("--strategy", choices = sorted(STRATEGIES), default = "entropy")
+    parser.add_argument("--games", type = int, default = 1000)
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--word-size", type = int, default = DEFAULT_WORD_SIZE, choices = range(4, 11), metavar = "4-10")
+    parser.add_argument("--workers", type = int, default = None)
+    parser.add_argument("--output", help = "write the results to this JSON file")
+    args = parser.parse_args()
+
+    summary = simulate(args.strategy, args.games, args.seed, args.workers, word_size = args.word_size)
+    text = json.dumps(summary, indent = 2)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
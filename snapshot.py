@@ -0,0 +1,196 @@
+"""
+File: snapshot.py
+Authors: Wordle game contributors
+Date: 17 October 2026
+Description: Compact saved games. A GameState holds a game in fixed-size byte
+arrays (the hidden word, the guesses and their patterns) and serializes to a
+few dozen bytes: 47 for a finished 5 letter game. Saved games can be resumed
+after a restart, and a server can checkpoint or move games between processes.
+
+Layout: header (version, word size, number of guesses, flags, guesses made,
+letters typed in the current row), the hidden word, the guesses, the patterns
+(1, 2 or 4 bytes each, little endian, depending on the word size), then the
+letters typed in the current row. Letters are stored as ASCII.
+"""
+
+# Imports
+import struct
+import sys
+from array import array
+
+from scoring import MAX_WORD_SIZE, score, winning_pattern
+from session import GameSession
+
+VERSION = 1
+HEADER_FORMAT = "<BBBBBB"   # version, word size, number of guesses, flags, guesses made, letters typed
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+# Flags
+GUESSES_MUST_BE_WORDS = 1
+HARD_MODE = 2
+STARTED = 4
+ADVERSARIAL = 8
+
+LETTERS = frozenset(b"abcdefghijklmnopqrstuvwxyz")
+
+
+def pattern_typecode(word_size):
+    """
+    Array typecode of the smallest unsigned type that holds every pattern of a word size
+    """
+    if 3 ** word_size <= 1 << 8:
+        return "B"
+    if 3 ** word_size <= 1 << 16:
+        return "H"
+    return "I"
+
+
+class GameState:
+    __slots__ = ("WORD_SIZE", "NUM_GUESSES", "flags", "guesses_made", "word", "guesses", "patterns", "typed")
+
+    def __init__(self, word_size, num_guesses):
+        """
+        Create an empty state for a game of the given size
+        """
+        self.WORD_SIZE = word_size
+        self.NUM_GUESSES = num_guesses
+        self.flags = 0
+        self.guesses_made = 0
+        self.word = bytearray(word_size)
+        self.guesses = bytearray(word_size * num_guesses)   # guess i is at i * word size
+        self.patterns = array(pattern_typecode(word_size), [0]) * num_guesses
+        self.typed = b""        # letters typed in the current row
+
+    def to_bytes(self):
+        """
+        Serialize the state, leaving out the rows not guessed yet
+        """
+        patterns = self.patterns[:self.guesses_made]
+        if sys.byteorder == "big":
+            patterns.byteswap()
+        return (struct.pack(HEADER_FORMAT, VERSION, self.WORD_SIZE, self.NUM_GUESSES, self.flags,
+                self.guesses_made, len(self.typed))
+            + bytes(self.word) + bytes(self.guesses[:self.guesses_made * self.WORD_SIZE])
+            + patterns.tobytes() + self.typed)
+
+    def restore(self, short_list, long_list, rng = None):
+        """
+        Build a session that carries on the saved game. Raises ValueError if no
+        answer of an adversarial game fits its guesses.
+        """
+        if self.flags & ADVERSARIAL:
+            # NumPy is only needed for adversarial games
+            from absurdle import AbsurdleSession
+            session = AbsurdleSession(short_list, long_list, self.WORD_SIZE, self.NUM_GUESSES, rng)
+        else:
+            session = GameSession(short_list, long_list, self.WORD_SIZE, self.NUM_GUESSES, rng)
+
+        session.guesses_must_be_words = bool(self.flags & GUESSES_MUST_BE_WORDS)
+        session.hard_mode = bool(self.flags & HARD_MODE)
+        if self.flags & STARTED:
+            # An adversarial game has no word until restore_candidates chooses one
+            session.word = "" if self.flags & ADVERSARIAL else self.word.decode("ascii")
+            session.game_started = True
+            for i in range(self.guesses_made):
+                guess = self.guesses[i * self.WORD_SIZE:(i + 1) * self.WORD_SIZE].decode("ascii")
+                session.apply_guess(guess, self.patterns[i])
+            for letter in self.typed.decode("ascii"):
+                session.type_letter(letter)
+            if self.flags & ADVERSARIAL:
+                session.restore_candidates()
+                if len(session.candidates) == 0:
+                    raise ValueError("Not a saved game")
+        return session
+
+
+def capture(session):
+    """
+    Return the GameState of a single board session
+    """
+    if hasattr(session, "NUM_BOARDS"):
+        raise ValueError("Only single board games can be saved")
+
+    state = GameState(session.WORD_SIZE, session.NUM_GUESSES)
+    state.flags = ((GUESSES_MUST_BE_WORDS if session.guesses_must_be_words else 0)
+        | (HARD_MODE if session.hard_mode else 0)
+        | (STARTED if session.game_started else 0)
+        | (ADVERSARIAL if hasattr(session, "candidates") else 0))
+    if session.game_started and session.word != "":
+        state.word[:] = session.word.encode("ascii")
+    state.guesses_made = len(session.history)
+    for i in range(len(session.history)):
+        guess, pattern = session.history[i]
+        state.guesses[i * session.WORD_SIZE:(i + 1) * session.WORD_SIZE] = guess.encode("ascii")
+        state.patterns[i] = pattern
+    state.typed = session.full_guess.encode("ascii")
+    return state
+
+
+def state_from_bytes(data):
+    """
+    Read a GameState written by GameState.to_bytes. Raises ValueError if the
+    data is not a saved game.
+    """
+    if len(data) < HEADER_SIZE:
+        raise ValueError("Not a saved game")
+    version, word_size, num_guesses, flags, guesses_made, num_typed = struct.unpack_from(HEADER_FORMAT, data)
+    if version != VERSION or not (0 < word_size <= MAX_WORD_SIZE) or guesses_made > num_guesses or num_typed > word_size:
+        raise ValueError("Not a saved game")
+    if not (flags & STARTED) and guesses_made + num_typed > 0:
+        raise ValueError("Not a saved game")
+
+    state = GameState(word_size, num_guesses)
+    pattern_size = state.patterns.itemsize
+    expected = HEADER_SIZE + word_size + guesses_made * (word_size + pattern_size) + num_typed
+    if len(data) != expected:
+        raise ValueError("Not a saved game")
+
+    position = HEADER_SIZE
+    state.flags = flags
+    state.guesses_made = guesses_made
+    state.word[:] = data[position:position + word_size]
+    position += word_size
+    state.guesses[:guesses_made * word_size] = data[position:position + guesses_made * word_size]
+    position += guesses_made * word_size
+    patterns = array(state.patterns.typecode)
+    patterns.frombytes(data[position:position + guesses_made * pattern_size])
+    if sys.byteorder == "big":
+        patterns.byteswap()
+    state.patterns[:guesses_made] = patterns
+    position += guesses_made * pattern_size
+    state.typed = bytes(data[position:])
+
+    # Only lowercase letters can be stored
+    letters = bytes(state.guesses[:guesses_made * word_size]) + state.typed
+    if flags & STARTED and not (flags & ADVERSARIAL):
+        letters += bytes(state.word)
+    if not set(letters) <= LETTERS:
+        raise ValueError("Not a saved game")
+
+    # Every pattern must be one the game could have given, and nothing can
+    # follow a win
+    win = winning_pattern(word_size)
+    for i in range(guesses_made):
+        if state.patterns[i] > win or (state.patterns[i] == win and i != guesses_made - 1):
+            raise ValueError("Not a saved game")
+        if not (flags & ADVERSARIAL):
+            guess = state.guesses[i * word_size:(i + 1) * word_size].decode("ascii")
+            if state.patterns[i] != score(guess, state.word.decode("ascii")):
+                raise ValueError("Not a saved game")
+    return state
+
+
+def save_session(session, path):
+    """
+    Write a session to a file
+    """
+    with open(path, "wb") as file:
+        file.write(capture(session).to_bytes())
+
+
+def load_session(path, short_list, long_list, rng = None):
+    """
+    Read a session saved by save_session
+    """
+    with open(path, "rb") as file:
+        return state_from_bytes(file.read()).restore(short_list, long_list, rng)
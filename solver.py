@@ -0,0 +1,158 @@
+"""
+File: solver.py
+Authors: Wordle game contributors
+Date: 17 October 2026
+Description: Hint solver. Keeps the answers that are still possible after every
+guess and ranks next guesses by expected information (entropy of the patterns).
+"""
+
+# Imports
+import numpy as np
+
+from batch_scoring import encode_words, score_batch
+
+# Largest number of (guess, pattern) counters to count with one bincount
+MAX_BINCOUNT_SIZE = 1 << 24
+
+
+class Solver:
+    def __init__(self, patterns, opening_book = None, weights = None):
+        """
+        Create a solver on top of a PatternMatrix, optionally starting from an
+        OpeningBook. If weights are given (one per answer, see frequency.py),
+        answers are taken to be likely in proportion to their weights.
+        """
+        self.patterns = patterns
+        self.opening_book = opening_book
+        self.weights = None if weights is None else np.asarray(weights, dtype = np.float64)
+        self.word_size = len(patterns.guesses[0])
+        self.num_patterns = 3 ** self.word_size
+        self.encoded_answers = encode_words(list(patterns.answers), self.word_size)
+
+        # Row of every answer in the matrix, or -1 if the answer is not a valid guess
+        self.answer_rows = np.array([patterns.guess_index.get(answer, -1) for answer in patterns.answers],
+            dtype = np.int64)
+
+        self.reset()
+
+    def reset(self):
+        """
+        Start a new game, where every answer is possible
+        """
+        self.candidates = np.arange(len(self.patterns.answers))
+        self.history = []
+
+    def update(self, guess, pattern):
+        """
+        Keep only the answers that would have given this pattern for this guess
+        """
+        if guess in self.patterns.guess_index:
+            row = self.patterns.matrix[self.patterns.guess_index[guess], self.candidates]
+        else:
+            row = score_batch(guess, self.encoded_answers[self.candidates])
+        self.candidates = self.candidates[row == pattern]
+        self.history.append((guess, pattern))
+
+    def remaining(self):
+        """
+        Answers that are still possible
+        """
+        return [self.patterns.answers[i] for i in self.candidates]
+
+    def entropies(self, candidates = None, rows = None):
+        """
+        Expected information, in bits, of the guesses in rows (all guesses by default)
+        over the given answer indexes (the remaining answers by default)
+        """
+        if candidates is None:
+            candidates = self.candidates
+        matrix = self.patterns.matrix if rows is None else self.patterns.matrix[rows]
+        num_guesses = matrix.shape[0]
+        if len(candidates) == 0:
+            return np.zeros(num_guesses)
+
+        # Give every (guess, pattern) pair its own number, for all guesses at once
+        sub_matrix = matrix[:, candidates].astype(np.int64)
+        sub_matrix += np.arange(num_guesses, dtype = np.int64)[:, None] * self.num_patterns
+
+        # With weights, every pair counts the weight of its answer instead of 1
+        if self.weights is None:
+            pair_weights = None
+            total = len(candidates)
+        else:
+            candidate_weights = self.weights[candidates]
+            pair_weights = np.broadcast_to(candidate_weights, sub_matrix.shape).ravel()
+            total = candidate_weights.sum()
+
+        if num_guesses * self.num_patterns <= MAX_BINCOUNT_SIZE:
+            # Few patterns (short words): count every pair with one bincount
+            counts = np.bincount(sub_matrix.ravel(), weights = pair_weights, minlength = num_guesses * self.num_patterns)
+            guess_of_count = np.repeat(np.arange(num_guesses), self.num_patterns)
+        else:
+            # Many patterns (long words): sort the pairs and count the runs instead
+            order = np.argsort(sub_matrix.ravel())
+            pairs = sub_matrix.ravel()[order]
+            starts = np.flatnonzero(np.r_[True, pairs[1:] != pairs[:-1]])
+            if pair_weights is None:
+                counts = np.diff(np.r_[starts, len(pairs)])
+            else:
+                counts = np.add.reduceat(pair_weights[order], starts)
+            guess_of_count = pairs[starts] // self.num_patterns
+
+        probabilities = counts / total
+        with np.errstate(divide = "ignore", invalid = "ignore"):
+            information = np.where(counts > 0, -probabilities * np.log2(probabilities), 0.0)
+        return np.bincount(guess_of_count, weights = information, minlength = num_guesses)
+
+    def rank(self, entropy, candidates, count, rows = None):
+        """
+        Order guesses by entropy, best first, and return the top count as
+        (guess, entropy). Guesses that could still be the answer win ties.
+        If rows is given, entropy holds only the guesses in those rows.
+        """
+        possible = np.zeros(len(self.patterns.guesses), dtype = bool)
+        answer_rows = self.answer_rows[candidates]
+        possible[answer_rows[answer_rows >= 0]] = True
+        if rows is None:
+            rows = np.arange(len(entropy))
+        else:
+            possible = possible[rows]
+
+        order = np.lexsort((~possible, -entropy))[:count]
+        return [(self.patterns.guesses[rows[i]], float(entropy[i])) for i in order]
+
+    def rank_guesses(self, count = 10, rows = None):
+        """
+        Return the best guesses as a list of (guess, entropy), best first,
+        choosing only from the guesses in rows if it is given
+        """
+        if len(self.candidates) <= 2:
+            return [(word, 0.0) for word in self.remaining()]
+        if rows is not None:
+            rows = np.asarray(rows, dtype = np.int64)
+        return self.rank(self.entropies(rows = rows), self.candidates, count, rows)
+
+    def book_guess(self):
+        """
+        Next guess from the opening book, or None if the game has left the book
+        """
+        if self.opening_book == None:
+            return None
+        if len(self.history) == 0:
+            return self.opening_book.opener
+        if len(self.history) == 1 and self.history[0][0] == self.opening_book.opener:
+            return self.opening_book.second_guesses[self.history[0][1]]
+        return None
+
+    def best_guess(self, rows = None):
+        """
+        The single best next guess, or None if no answer is possible. If rows is
+        given (for example the guesses allowed in hard mode), only those guesses
+        are considered.
+        """
+        book_guess = self.book_guess()
+        if book_guess != None and (rows is None or self.patterns.guess_index[book_guess] in rows):
+            return book_guess
+
+        ranked = self.rank_guesses(1, rows)
+        return ranked[0][0] if ranked else None
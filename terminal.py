@@ -0,0 +1,96 @@
+"""
+File: terminal.py
+Authors: Wordle game contributors
+Date: 17 October 2026
+Description: Plain terminal front end for Wordle. Runs a GameSession without
+Tkinter, so it works over ssh and on machines with no display.
+
+    python terminal.py [--word WORD | --daily | --puzzle N | --adversarial] [--word-size N] [--no-word-check] [--hard] [--show-word]
+"""
+
+# Imports
+import argparse
+import sys
+
+from daily import puzzle_number, puzzle_word
+from scoring import decode
+from session import GameSession
+from wordlist_cache import load_dictionary, load_weights
+
+# ANSI background colors indexed by pattern color (GRAY, ORANGE, GREEN)
+COLOR_CODES = ["\033[100m", "\033[43m", "\033[42m"]
+RESET_CODE = "\033[0m"
+
+
+def color_row(guess, pattern, use_color):
+    """
+    Format a scored guess, with colors or with the letters marked by -, ? and +
+    """
+    colors = decode(pattern, len(guess))
+    cells = []
+    for i in range(len(guess)):
+        if use_color:
+            cells.append(COLOR_CODES[colors[i]] + "\033[97m " + guess[i].upper() + " " + RESET_CODE)
+        else:
+            cells.append(guess[i].upper() + "-?+"[colors[i]])
+    return " ".join(cells)
+
+
+def play(session, input_file = sys.stdin, output_file = sys.stdout, use_color = True):
+    """
+    Read one guess per line until the game is finished or the input ends
+    """
+    while session.is_playing():
+        output_file.write("Guess " + str(session.guess_row) + "/" + str(session.NUM_GUESSES) + ": ")
+        output_file.flush()
+        line = input_file.readline()
+        if line == "":
+            break
+
+        guesses_made = len(session.history)
+        message = session.enter_word(line.strip())
+        if len(session.history) > guesses_made:
+            guess, pattern = session.history[-1]
+            output_file.write(color_row(guess, pattern, use_color) + "\n")
+        if message != None:
+            output_file.write(message + "\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Play Wordle in the terminal")
+    parser.add_argument("--word", help = "use this hidden word instead of a random one")
+    parser.add_argument("--daily", action = "store_true", help = "play today's puzzle")
+    parser.add_argument("--puzzle", type = int, help = "play the puzzle with this number")
+    parser.add_argument("--adversarial", action = "store_true", help = "the answer dodges your guesses (like Absurdle)")
+    parser.add_argument("--word-size", type = int, default = 5, choices = range(4, 11), metavar = "4-10",
+        help = "number of letters in the hidden word")
+    parser.add_argument("--guesses", type = int, default = 6, help = "number of guesses")
+    parser.add_argument("--no-word-check", action = "store_true", help = "allow guesses that are not words")
+    parser.add_argument("--hard", action = "store_true", help = "revealed hints must be used in later guesses")
+    parser.add_argument("--show-word", action = "store_true", help = "print the hidden word")
+    args = parser.parse_args()
+
+    short_list = load_dictionary("short_wordlist.txt", args.word_size)
+    long_list = load_dictionary("long_wordlist.txt", args.word_size)
+    if args.adversarial:
+        # NumPy is only needed for adversarial games
+        from absurdle import AbsurdleSession
+        session = AbsurdleSession(short_list, long_list, args.word_size, args.guesses)
+    else:
+        weights, sampler = load_weights("short_wordlist.txt", args.word_size)
+        session = GameSession(short_list, long_list, args.word_size, args.guesses, sampler = sampler)
+    session.guesses_must_be_words = not args.no_word_check
+    session.hard_mode = args.hard
+
+    word = args.word
+    if args.daily or args.puzzle != None:
+        number = args.puzzle if args.puzzle != None else puzzle_number()
+        word = puzzle_word("short_wordlist.txt", args.word_size, number)
+        print("Puzzle #" + str(number))
+    error = session.start(word)
+    if error != None:
+        sys.exit(error)
+    if args.show_word and not args.adversarial:
+        print("Hidden word = " + session.word)
+
+    play(session, use_color = sys.stdout.isatty())
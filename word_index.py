@@ -0,0 +1,181 @@
+"""
+File: word_index.py
+Authors: Wordle game contributors
+Date: 17 October 2026
+Description: Bitset index of a word list for pattern queries such as "words
+matching ?R??E that contain A but not S or T". Every (position, letter) and
+every (letter, count) has a Python int whose bit j is set when word j has that
+property, so a query is a few ANDs instead of a scan over every word.
+
+    python word_index.py ?r??e [--contains a] [--excludes st] [--answers] [--page N]
+"""
+
+# Imports
+import argparse
+from itertools import islice
+
+ORD_A = ord('a')
+LETTERS = frozenset("abcdefghijklmnopqrstuvwxyz")
+WILDCARDS = "?._"   # pattern characters that match any letter
+
+
+class WordQuery:
+    __slots__ = ("words", "bits")
+
+    def __init__(self, words, bits):
+        """
+        Words of a sorted list whose bit is set in bits
+        """
+        self.words = words
+        self.bits = bits
+
+    def __len__(self):
+        """
+        Number of matching words
+        """
+        return self.bits.bit_count()
+
+    def indexes(self):
+        """
+        Yield the index of every matching word, in order, without building a list
+        """
+        digits = bin(self.bits)[:1:-1]     # character j is bit j
+        j = digits.find("1")
+        while j != -1:
+            yield j
+            j = digits.find("1", j + 1)
+
+    def __iter__(self):
+        """
+        Yield every matching word in sorted order
+        """
+        words = self.words
+        for j in self.indexes():
+            yield words[j]
+
+    def page(self, number, size = 20):
+        """
+        The words of one page of results, counting pages from 0
+        """
+        return list(islice(iter(self), number * size, (number + 1) * size))
+
+
+class WordIndex:
+    def __init__(self, words):
+        """
+        Index a sorted list of words that all have the same size
+        """
+        self.words = tuple(words)
+        self.WORD_SIZE = len(self.words[0]) if self.words else 0
+        num_bytes = (len(self.words) + 7) // 8
+
+        # Set the bits in byte arrays first; or-ing bits into big ints one word
+        # at a time would copy the whole int for every word
+        at = [[bytearray(num_bytes) for letter in range(26)] for i in range(self.WORD_SIZE)]
+        at_least = [[] for letter in range(26)]
+        for j in range(len(self.words)):
+            byte = j >> 3
+            bit = 1 << (j & 7)
+            counts = [0] * 26
+            for i in range(self.WORD_SIZE):
+                index = ord(self.words[j][i]) - ORD_A
+                at[i][index][byte] |= bit
+                counts[index] += 1
+                if counts[index] > len(at_least[index]):
+                    at_least[index].append(bytearray(num_bytes))
+                at_least[index][counts[index] - 1][byte] |= bit
+
+        self.all = (1 << len(self.words)) - 1
+        self.at = [[int.from_bytes(bits, "little") for bits in position] for position in at]
+        # at_least[letter][k - 1]: words with the letter at least k times
+        self.at_least_bits = [[int.from_bytes(bits, "little") for bits in counts] for counts in at_least]
+
+    def at_least(self, letter, count):
+        """
+        Bitset of the words that have a letter at least count times
+        """
+        if count <= 0:
+            return self.all
+        counts = self.at_least_bits[ord(letter) - ORD_A]
+        return counts[count - 1] if count <= len(counts) else 0
+
+    def query(self, pattern = None, contains = "", excludes = ""):
+        """
+        Words matching a pattern like "?r??e" ("?", "." or "_" match any letter),
+        with every letter of contains (a letter given twice must appear twice)
+        and none of the letters of excludes
+        """
+        bits = self.all
+        contains = contains.lower()
+        excludes = excludes.lower()
+        if not set(contains + excludes) <= LETTERS:
+            raise ValueError("Letters must be a to z")
+        if pattern != None:
+            pattern = pattern.lower()
+            if len(pattern) != self.WORD_SIZE:
+                raise ValueError("Pattern must have " + str(self.WORD_SIZE) + " letters")
+            if not set(pattern) <= LETTERS | set(WILDCARDS):
+                raise ValueError("Pattern must only have letters a to z and " + WILDCARDS)
+            for i in range(self.WORD_SIZE):
+                if pattern[i] not in WILDCARDS:
+                    bits &= self.at[i][ord(pattern[i]) - ORD_A]
+
+        for letter in set(contains):
+            bits &= self.at_least(letter, contains.count(letter))
+        for letter in set(excludes):
+            bits &= ~self.at_least(letter, 1)
+        return WordQuery(self.words, bits)
+
+    def matching(self, constraints):
+        """
+        Words that could still be the hidden word under a Constraints
+        """
+        bits = self.hard_mode_bits(constraints)
+        for i in range(self.WORD_SIZE):
+            if constraints.fixed[i] == None:
+                for letter in constraints.not_at[i]:
+                    bits &= ~self.at[i][ord(letter) - ORD_A]
+        for index in range(26):
+            if constraints.max_counts[index] < self.WORD_SIZE:
+                bits &= ~self.at_least(chr(ORD_A + index), constraints.max_counts[index] + 1)
+        return WordQuery(self.words, bits)
+
+    def hard_mode_guesses(self, constraints):
+        """
+        Words that are allowed as the next guess in hard mode under a Constraints
+        """
+        return WordQuery(self.words, self.hard_mode_bits(constraints))
+
+    def hard_mode_bits(self, constraints):
+        """
+        Bitset of the words with every revealed green and found letter
+        """
+        bits = self.all
+        for i in range(self.WORD_SIZE):
+            if constraints.fixed[i] != None:
+                bits &= self.at[i][ord(constraints.fixed[i]) - ORD_A]
+        for letter in constraints.required:
+            bits &= self.at_least(letter, constraints.min_counts[ord(letter) - ORD_A])
+        return bits
+
+
+if __name__ == "__main__":
+    from wordlist_cache import load_index
+
+    parser = argparse.ArgumentParser(description = "Find words matching a pattern")
+    parser.add_argument("pattern", help = "letters and ? for unknown letters, like ?r??e")
+    parser.add_argument("--contains", default = "", help = "letters the word must contain")
+    parser.add_argument("--excludes", default = "", help = "letters the word must not contain")
+    parser.add_argument("--answers", action = "store_true", help = "search the answer list instead of all guesses")
+    parser.add_argument("--page", type = int, default = 0, help = "page of results to show, from 0")
+    parser.add_argument("--page-size", type = int, default = 20, help = "results per page")
+    args = parser.parse_args()
+
+    filename = "short_wordlist.txt" if args.answers else "long_wordlist.txt"
+    try:
+        result = load_index(filename, len(args.pattern)).query(args.pattern, args.contains, args.excludes)
+    except ValueError as error:
+        parser.error(str(error))
+    for word in result.page(args.page, args.page_size):
+        print(word)
+    print(str(len(result)) + " words")
@@ -6,23 +6,38 @@ Description: Fully working version of popular word guessing game Wordle.
 """
 
 # Imports
-import random
+import argparse
+import os
 import tkinter as tk
 import tkinter.font as font
 from enum import Enum
+import sys
+import threading
 import time
-from turtle import up
 
-from numpy import full
+from daily import puzzle_number, puzzle_word
+from history import HistoryStore
+from profiling import profiler_from_settings
+from render import CanvasTile, Renderer
+from scoring import decode
+from session import GameSession
+from snapshot import ADVERSARIAL, STARTED, capture, state_from_bytes
+from wordlist_cache import load_dictionary, load_index, load_weights
 
 class Wordle:
-    def __init__(self):
+    def __init__(self, word_size = 5, num_guesses = 6, profile = None):
         """ Initialize the game """
         # Constants
-        self.WORD_SIZE = 5  # number of letters in the hidden word
-        self.NUM_GUESSES = 6 # number of guesses that the user gets 
+        self.WORD_SIZE = word_size  # number of letters in the hidden word
+        self.NUM_GUESSES = num_guesses # number of guesses that the user gets 
+        self.MIN_WORD_SIZE = 4      # word sizes that can be chosen in the window
+        self.MAX_WORD_SIZE = 10
+        self.NUM_BOARDS = 1         # boards played at once; every extra board adds a guess
+        self.SINGLE_BOARD_GUESSES = num_guesses
+        self.MAX_BOARDS = 8
         self.LONG_WORDLIST_FILENAME = "long_wordlist.txt"
         self.SHORT_WORDLIST_FILENAME = "short_wordlist.txt"
+        self.SAVED_GAME_FILENAME = "wordle_saved_game.bin"  # unfinished game, resumed on the next start
 
         # Size of the frame that holds all guesses.  This is the upper left
         # frame in the window.
@@ -34,31 +49,42 @@ class Wordle:
         self.show_word = False
         self.specify_word = False
         self.repeated_letters = False
-        self.game_started = False
-        self.game_finished = False
-        self.game_won = False
         self.incorrect_guess = False
-        
-        self.word = ""
-        self.full_guess = ""
 
         self.window = tk.Tk()
         self.window.title("Wordle")
+        self.renderer = Renderer(self.window)   # batches color changes of all widgets
 
         self.previous_indexes = []
-        self.colors_list = []
 
         self.buttons = {}
-        self.guess_boxes = {}
-        self.guess_frames = {}
-        self.letters = {}
-        self.letter_instances_word = {}
-        self.letter_instances_guess = {}
-        self.repeats = {}
-        self.buttons_color_changed = {}
-
-        self.guess_row = 1
-        self.guess_column = 1
+        self.solver = None          # hint solver, created on the first hint
+        self.first_hint = None      # best first guess of the solver, found while it is built
+        self.solver_loader = None   # thread building the hint solver, while it runs
+        self.loaded_solver = None   # (word size, solver or None, first hint or error) left by that thread
+        self.history_store = HistoryStore() # saves games in the background
+        self.game_id = None
+        self.board_game_ids = []    # history game id of every board of a multi-board game
+
+        # Timing of the hot paths, only when asked for (see profiling.py)
+        self.profiler = profiler_from_settings(profile)
+        if self.profiler != None:
+            self.profiler.instrument(self, ["read_files", "guess_frame_method", "keyboard_frame_method",
+                "all_control_frames", "control_frame_message", "control_frame_widgets",
+                "control_frame_buttons", "submit_guess", "process_guesses", "reveal_tile",
+                "redraw_row", "process_key_queue", "hint", "board_canvases_method"])
+            self.profiler.instrument(self.renderer, ["flush"])
+
+        # State of the tile reveal animation
+        self.animating = False
+        self.input_buffer = []      # key presses made during the animation
+        self.pending_message = None # message to show once the animation finishes
+        self.max_frame_lateness_ms = 0  # worst delay of an animation frame past its due time
+
+        # State of physical keyboard input
+        self.key_queue = []         # key presses waiting for the next pass of the event loop
+        self.keys_scheduled = False
+        self.row_redraw_scheduled = False
 
         # Parameters for an individual letter in the guess frame
         # A guess frame is an individual box that contains a guessed letter.
@@ -83,6 +109,9 @@ class Wordle:
                                             # and in the correct location.
         self.GUESS_FRAME_TEXT_AFTER = 'white' # color of text in guess box after
                                             # the guess is entered.
+        # Guess box colors indexed by pattern color (GRAY, ORANGE, GREEN)
+        self.GUESS_FRAME_COLORS = [self.GUESS_FRAME_BG_WRONG,
+            self.GUESS_FRAME_BG_CORRECT_WRONG_LOC, self.GUESS_FRAME_BG_CORRECT_RIGHT_LOC]
         self.FONT_FAMILY = 'ariel'          # Font to use for letters in the guess boxes.
         self.FONT_SIZE_GUESS = 34           # Font size for letters in the guess boxes.
 
@@ -108,6 +137,8 @@ class Wordle:
         self.KEYBOARD_BUTTON_BG_CORRECT_WRONG_LOC = 'orange' 
         self.KEYBOARD_BUTTON_BG_CORRECT_RIGHT_LOC = 'green' 
         self.KEYBOARD_BUTTON_TEXT_AFTER = 'white' 
+        self.KEYBOARD_BUTTON_COLORS = [self.KEYBOARD_BUTTON_BG_WRONG,
+            self.KEYBOARD_BUTTON_BG_CORRECT_WRONG_LOC, self.KEYBOARD_BUTTON_BG_CORRECT_RIGHT_LOC]
 
         self.KEYBOARD_BUTTON_NAMES = [   
             ["Q", "W", "E", "R", "T", "Y", "U", "I", "O", "P"],
@@ -123,10 +154,21 @@ class Wordle:
 
         self.MESSAGE_DISPLAY_TIME_SECS = 5 # Length of time the message should be
                                             # displayed.
-        self.PROCESS_GUESS_WAITTIME = 1  # When processing a guess (changing color
+        self.PROCESS_GUESS_WAITTIME = 250  # When processing a guess (changing color
                                         # of the guess frames), time to wait between
-                                        # updating successive frames.        
+                                        # updating successive frames, in milliseconds.
+        self.INPUT_BUFFER_SIZE = 16     # Key presses remembered while a guess is being
+                                        # revealed before repeats of a letter are ignored.
+        self.SOLVER_POLL_TIME = 100     # While the hint solver is being built, time
+                                        # between checks whether it is ready, in milliseconds.
         
+        # An unfinished game from last time decides the size of the board
+        saved_state, saved_game_id = self.read_saved_game()
+        if saved_state != None:
+            self.WORD_SIZE = saved_state.WORD_SIZE
+            self.NUM_GUESSES = saved_state.NUM_GUESSES
+            self.SINGLE_BOARD_GUESSES = saved_state.NUM_GUESSES
+
         # Run initial methods
         self.read_files()
         self.guess_frame_method()
@@ -135,20 +177,40 @@ class Wordle:
         self.control_frame_message()
         self.control_frame_widgets()
         self.control_frame_buttons()
-        self.colors_list_creation()
+        self.key_bindings()
+        if saved_state != None:
+            self.resume_game(saved_state, saved_game_id)
 
         self.window.mainloop()
+        try:
+            self.save_game()
+        finally:
+            self.history_store.close()
+            if self.profiler != None:
+                self.profiler.finish()
+                print("Worst animation frame lateness = " + str(round(self.max_frame_lateness_ms, 1)) + " ms",
+                    file = sys.stderr)
 
     def guess_frame_method(self):
         """
         Create guess frame
         """
+        self.guess_boxes = {}
+        self.guess_frames = {}
+        self.letters = {}
+        self.guess_box_text = {}    # text last shown in every guess box
+        self.board_tiles = {}       # guess boxes of every board when playing several
+
         self.guess_frame = tk.Frame(self.window, 
             borderwidth = 1, relief = 'solid',
             height = self.PARENT_GUESS_FRAME_HEIGHT, width = self.PARENT_GUESS_FRAME_WIDTH)
         self.guess_frame.grid(row = 1, column = 1)
         self.guess_frame.grid_propagate(False)
 
+        if self.NUM_BOARDS > 1:
+            self.board_canvases_method()
+            return
+
         # Create and position letter frames
         for r in range(self.NUM_GUESSES):
             for c in range(self.WORD_SIZE):
@@ -175,202 +237,273 @@ class Wordle:
         
         # Center guess frame boxes
         self.guess_frame.rowconfigure(0, weight = 1)
-        self.guess_frame.rowconfigure(7, weight = 1)
+        self.guess_frame.rowconfigure(self.NUM_GUESSES + 1, weight = 1)
         self.guess_frame.columnconfigure(0, weight = 1)
-        self.guess_frame.columnconfigure(6, weight = 1)
+        self.guess_frame.columnconfigure(self.WORD_SIZE + 1, weight = 1)
 
-    def button_handler(self, text):
+    def board_canvases_method(self):
         """
-        Prints the text of the button that was pressed
-        """
-        if self.game_started == True and self.game_finished == False:
-            # Checks to do if 'enter' button is clicked
-            if text == 'ENTER':
-                if self.guess_column == 6:
-                    self.word_valid_check()
-                    
-                    # Display if game is lost
-                    if self.guess_row == 7 and self.game_won == False:
-                        wrong_error = "Guesses used up. \n" + "Word was " + self.word + ". Game over."
-                        self.message_display(self.MESSAGE_DISPLAY_TIME_SECS, wrong_error)
-                        self.game_finished = True
-                        self.process_guesses()
-                        self.full_guess = ""
-                
-                # Message if word is less than 5 letters
-                else:
-                    self.message_display(self.MESSAGE_DISPLAY_TIME_SECS, "Word not finished")
-
-            elif text == 'BACK':
-                # Delete letter if back button is clicked and there are letters to delete
-                if self.guess_column != 1:
-                    self.guess_column -= 1
-                    box = self.guess_boxes[(self.guess_row, self.guess_column)]
-                    box.set('     ')
-            elif self.guess_column == 6:
-                pass
-            else:
-                # Display types letter
-                box = self.guess_boxes[(self.guess_row, self.guess_column)]
-                self.guess_column += 1
-                box.set(text)
+        Create one canvas per board in the guess frame. Boxes are drawn on the
+        canvases, so even 8 boards only add 8 widgets.
+        """
+        columns = min(self.NUM_BOARDS, 4)
+        rows = (self.NUM_BOARDS + columns - 1) // columns
+        margin = self.GUESS_FRAME_PADDING
+
+        # Shrink the boxes so every board fits in the guess frame
+        board_width = self.PARENT_GUESS_FRAME_WIDTH // columns - 4 * margin
+        board_height = self.PARENT_GUESS_FRAME_HEIGHT // rows - 4 * margin
+        step = min(self.GUESS_FRAME_SIZE + self.GUESS_FRAME_PADDING,
+            (board_width - self.GUESS_FRAME_PADDING) // self.WORD_SIZE,
+            (board_height - self.GUESS_FRAME_PADDING) // self.NUM_GUESSES)
+        size = step - self.GUESS_FRAME_PADDING
+        tile_font = (self.FONT_FAMILY, max(6, self.FONT_SIZE_GUESS * size // self.GUESS_FRAME_SIZE))
+
+        for b in range(self.NUM_BOARDS):
+            canvas = tk.Canvas(self.guess_frame, highlightthickness = 0,
+                width = self.WORD_SIZE * step + self.GUESS_FRAME_PADDING,
+                height = self.NUM_GUESSES * step + self.GUESS_FRAME_PADDING)
+            canvas.grid(row = b // columns + 1, column = b % columns + 1, padx = margin, pady = margin)
+
+            for r in range(self.NUM_GUESSES):
+                for c in range(self.WORD_SIZE):
+                    tile = CanvasTile(canvas, self.GUESS_FRAME_PADDING + c * step, self.GUESS_FRAME_PADDING + r * step,
+                        size, tile_font, self.GUESS_FRAME_BG_BEGIN, self.GUESS_FRAME_TEXT_BEGIN)
+                    self.board_tiles[(b, r + 1, c + 1)] = tile
+                    self.renderer.track(tile, bg = self.GUESS_FRAME_BG_BEGIN, fg = self.GUESS_FRAME_TEXT_BEGIN, text = "")
+
+        # Center the boards
+        self.guess_frame.rowconfigure(0, weight = 1)
+        self.guess_frame.rowconfigure(rows + 1, weight = 1)
+        self.guess_frame.columnconfigure(0, weight = 1)
+        self.guess_frame.columnconfigure(columns + 1, weight = 1)
 
-    def word_valid_check(self):
+    def button_handler(self, text):
         """
-        Checking if word is valid (if necessary), and then move on to next row if so
+        Passes the button that was pressed on to the game session and updates the board
         """
-        for i in range(self.WORD_SIZE):
-            box = self.guess_boxes[(self.guess_row, i + 1)]
-            letter = box.get()
-            self.full_guess += letter
-        
-        self.count_letters()
-        self.full_guess = self.full_guess.lower()
-
-        # Check if the guess is a valid word if the checkbox is clixked
-        if self.checkbox_wordguesses_var.get() == True:
-            if self.full_guess in self.long_list:
-                self.guess_row += 1
-                self.guess_column = 1
+        session = self.session
+
+        # Keep key presses for later while a guess is being revealed
+        if self.animating == True:
+            self.buffer_key(self.input_buffer, text)
+            return
+
+        # Checks to do if 'enter' button is clicked
+        if text == 'ENTER':
+            # Show the letters of the row before it is submitted
+            self.redraw_row()
+            guesses_made = len(session.history)
+            message = self.submit_guess()
+
+            # Reveal the row if the guess was accepted, and show the message after it
+            if len(session.history) > guesses_made:
+                self.save_guess()
+                self.pending_message = message
                 self.process_guesses()
-                self.full_guess = ""
-                self.letter_instances_guess = {}
-                self.letter_instances_word = {}
-                self.repeats = {}
-            
-            # If the guess is not a valid word display an error message
-            else:
-                not_word_error = self.full_guess + " is not in the word list"
-                self.message_display(self.MESSAGE_DISPLAY_TIME_SECS, not_word_error)
-                self.full_guess = ""
-                self.letter_instances_guess = {}
-                self.letter_instances_word = {}
-                self.repeats = {}
-        
-        # Move onto next row
+            elif message != None:
+                self.message_display(self.MESSAGE_DISPLAY_TIME_SECS, message)
+
+        elif text == 'BACK':
+            # Delete letter if back button is clicked and there are letters to delete
+            if session.backspace():
+                self.schedule_row_redraw()
         else:
-            self.guess_row += 1
-            self.guess_column = 1
-            self.process_guesses()
-            self.full_guess = ""
-            self.letter_instances_guess = {}
-            self.letter_instances_word = {}
-            self.repeats = {}
-    
-    def process_guesses(self):
+            # Display typed letter
+            if session.type_letter(text):
+                self.schedule_row_redraw()
+
+    def submit_guess(self):
         """
-        Takes guesses and compares with hidden word to color guess boxes with hints
-        """
-        for i in range(len(self.full_guess)):
-            upper_guess = self.full_guess[i].upper()
-            upper_letter = self.word[i].upper()          
-            self.repeats[i] = False      
-
-            # Change all correct letters to green, 
-            # and remember that they have been changed to green
-            if upper_letter == upper_guess:
-                self.color_changes('green', i)  
-                self.buttons[upper_guess]['fg'] = 'green'
-                self.letter_instances_guess[upper_guess] -= 1
-                self.letter_instances_word[upper_guess] -= 1
-                self.repeats[i] = True
-                self.buttons_color_changed[upper_guess] = True
-        
-        self.process_guesses_second_run()
+        Submits the current row to the game session and returns its message
+        """
+        return self.session.submit()
 
-        self.check_winning()
+    def schedule_row_redraw(self):
+        """
+        Redraws the current row once the event loop is idle, however many keys changed it
+        """
+        if self.row_redraw_scheduled == False:
+            self.row_redraw_scheduled = True
+            self.window.after_idle(self.redraw_row)
 
-    def process_guesses_second_run(self):
+    def redraw_row(self):
+        """
+        Shows the letters typed in the current row, only setting the boxes that changed
         """
-        Processes the guesses a second time for incorrect letters and letters in the wrong location
+        self.row_redraw_scheduled = False
+        session = self.session
+        if session.guess_row > self.NUM_GUESSES:
+            return
+
+        # Boards are updated through the renderer, which skips boxes that did not change
+        if self.NUM_BOARDS > 1:
+            for b in session.unsolved_boards():
+                for c in range(self.WORD_SIZE):
+                    text = session.full_guess[c].upper() if c < len(session.full_guess) else ""
+                    self.renderer.set(self.board_tiles[(b, session.guess_row, c + 1)], text = text)
+            return
+
+        for c in range(self.WORD_SIZE):
+            text = session.full_guess[c].upper() if c < len(session.full_guess) else '     '
+            if self.guess_box_text.get((session.guess_row, c + 1), '     ') != text:
+                self.guess_box_text[(session.guess_row, c + 1)] = text
+                self.guess_boxes[(session.guess_row, c + 1)].set(text)
+
+    def key_bindings(self):
         """
-        for i in range(len(self.full_guess)):
-            upper_guess = self.full_guess[i].upper()
-            upper_letter = self.word[i].upper()      
+        Lets the physical keyboard type letters, enter guesses and delete letters
+        """
+        self.window.bind('<Key>', self.key_press)
+        self.window.bind('<Return>', self.key_press)
+        self.window.bind('<BackSpace>', self.key_press)
 
-            # Check if the letter is in the word
-            if upper_guess in self.word.upper():
-                # Check if letter in the word repeats and if it needs to to 
-                # be made orange (repeated) or gray (does not appear again)
-                # Also change keyboard text colors to match guesses
-                if self.repeats[i] == False:
-                    if self.letter_instances_word[upper_guess] == 0:
-                        self.color_changes('gray', i)
+    def key_press(self, event):
+        """
+        Queues a key press; all keys pressed before the event loop is idle are handled together
+        """
+        # Typing in the specify word entry is not a guess
+        if isinstance(event.widget, tk.Entry):
+            return
+
+        if event.keysym == 'Return':
+            key = 'ENTER'
+        elif event.keysym == 'BackSpace':
+            key = 'BACK'
+        elif len(event.char) == 1 and 'a' <= event.char.lower() <= 'z':
+            key = event.char.upper()
+        else:
+            return
 
-                        if self.buttons_color_changed[upper_guess] == False:
-                            self.buttons[upper_guess]['fg'] = 'gray'
-                            self.buttons_color_changed[upper_guess]
-                    else:
-                        self.color_changes('orange', i)
-                        self.letter_instances_word[upper_guess] -= 1
-                        if self.buttons_color_changed[upper_guess] == False:
-                            self.buttons[upper_guess]['fg'] = 'orange'
-                            #if self.hard_mode == True:
-                                #self.colors_list[i] = 'orange'
-                               
-            else:
-                self.color_changes('gray', i)
-                self.buttons[upper_guess]['fg'] = 'gray'
+        self.buffer_key(self.key_queue, key)
+        if self.keys_scheduled == False:
+            self.keys_scheduled = True
+            self.window.after_idle(self.process_key_queue)
 
-                if self.buttons_color_changed[upper_guess] == False:
-                    self.buttons[upper_guess]['fg'] = 'gray'
-                    self.buttons_color_changed[upper_guess] = True
+    def buffer_key(self, keys, key):
+        """
+        Adds a key press to a list of waiting keys. Once the list is full, a held down
+        letter that repeats faster than it can be shown is dropped; ENTER, BACK and
+        every other key are always kept.
+        """
+        if len(keys) < self.INPUT_BUFFER_SIZE or key in ('ENTER', 'BACK') or key != keys[-1]:
+            keys.append(key)
+
+    def process_key_queue(self):
+        """
+        Passes every queued key press to the button handler
+        """
+        self.keys_scheduled = False
+        keys = self.key_queue
+        self.key_queue = []
+        for key in keys:
+            self.button_handler(key)
 
-    def colors_list_creation(self):
+    def save_guess(self):
         """
-        Creates a list of necessary length to remember colors of guesses
+        Queues the last submitted guess, and the result if the game is over, for the history store
         """
-        for i in range(self.WORD_SIZE):
-            self.colors_list.append("")
+        session = self.session
+        guess, pattern = session.history[-1]
+        number = len(session.history)
+
+        if self.NUM_BOARDS > 1:
+            # Every board is kept as a game of its own, with its word and patterns
+            for b in range(self.NUM_BOARDS):
+                if pattern[b] == None:
+                    continue
+                self.history_store.record_guess(self.board_game_ids[b], number, guess, pattern[b])
+                if session.solved_rows[b] == number:
+                    self.history_store.finish_game(self.board_game_ids[b], True, number)
+                elif session.game_finished == True:
+                    self.history_store.finish_game(self.board_game_ids[b], False, number)
+        elif self.game_id != None:
+            self.history_store.record_guess(self.game_id, number, guess, pattern)
+            if session.game_finished == True:
+                self.history_store.finish_game(self.game_id, session.game_won, number)
+        elif session.game_finished == True:
+            # An adversarial game only has a word once it is over, so it is kept then
+            game_id = self.history_store.start_game(session.word, self.WORD_SIZE, self.NUM_GUESSES)
+            for i in range(number):
+                self.history_store.record_guess(game_id, i + 1, *session.history[i])
+            self.history_store.finish_game(game_id, session.game_won, number)
 
-    def check_winning(self):
+    def process_guesses(self):
         """
-        Check if the player has won the game on that round
-        """    
-        count = 0
+        Starts revealing the colors of the last submitted row, one guess box at a time
+        """
+        guess, pattern = self.session.history[-1]
+        if self.NUM_BOARDS > 1:
+            # One list of colors per board, or None for boards already solved
+            colors = [None if board_pattern == None else decode(board_pattern, self.WORD_SIZE)
+                for board_pattern in pattern]
+        else:
+            colors = decode(pattern, self.WORD_SIZE)
 
-        # Count how many letters are correct
-        for i in self.repeats:
-            if self.repeats[i] == True:
-                count += 1
+        # Narrow the hint solver's remaining answers
+        if self.solver != None:
+            self.solver.update(guess, pattern)
 
-        if count == 5:
-            self.game_won = True
+        self.animating = True
+        self.reveal_tile(self.session.guess_row - 1, guess, colors, 0, time.perf_counter())
 
-        # If all letters are correct the game has been won
-        if self.game_won == True:
-            self.message_display(self.MESSAGE_DISPLAY_TIME_SECS, "Correct. Nice job. Game over")
-            self.game_finished = True
-            
-    def color_changes(self, color, i):
+    def reveal_tile(self, row, guess, colors, i, due):
         """
-        Modifies colors of guess boxes
+        Colors one guess box and schedules the next one with window.after, so the
+        event loop keeps running during the animation
         """
-        letter_label = self.letters[(self.guess_row - 1, i + 1)]
-        box = self.guess_frames[(self.guess_row - 1, i + 1)]
-        box.configure(bg = color)
-        letter_label.configure(bg = color)
-        letter_label.configure(fg = 'white')
-        
-    def count_letters(self):
+        now = time.perf_counter()
+        self.max_frame_lateness_ms = max(self.max_frame_lateness_ms, (now - due) * 1000)
+        if self.NUM_BOARDS > 1:
+            self.board_color_changes(colors, row, i)
+        else:
+            self.color_changes(self.GUESS_FRAME_COLORS[colors[i]], row, i)
+
+        if i + 1 < len(guess):
+            # Schedule against the due time rather than now, so delays do not add up
+            next_due = due + self.PROCESS_GUESS_WAITTIME / 1000
+            delay = max(0, int((next_due - now) * 1000))
+            self.window.after(delay, self.reveal_tile, row, guess, colors, i + 1, next_due)
+        else:
+            self.reveal_finished(guess)
+
+    def reveal_finished(self, guess):
         """
-        Counts instances of every letter in the hidden word
+        Colors the keyboard, shows any message and replays keys pressed during the animation
         """
-        # Count instances of letters in the hidden word
-        for i in self.word.upper():
-            if i in self.letter_instances_word:
-                self.letter_instances_word[i] += 1
-            else:
-                self.letter_instances_word[i] = 1
+        for letter in guess:
+            # Keyboard colors only ever improve (gray -> orange -> green)
+            color = self.session.letter_colors[letter]
+            self.renderer.set(self.buttons[letter.upper()], fg = self.KEYBOARD_BUTTON_COLORS[color])
+
+        self.animating = False
+        if self.pending_message != None:
+            self.message_display(self.MESSAGE_DISPLAY_TIME_SECS, self.pending_message)
+            self.pending_message = None
+
+        buffered = self.input_buffer
+        self.input_buffer = []
+        for text in buffered:
+            self.button_handler(text)
+
+    def color_changes(self, color, row, i):
+        """
+        Modifies colors of guess boxes (applied together on the next redraw)
+        """
+        letter_label = self.letters[(row, i + 1)]
+        box = self.guess_frames[(row, i + 1)]
+        self.renderer.set(box, bg = color)
+        self.renderer.set(letter_label, bg = color, fg = self.GUESS_FRAME_TEXT_AFTER)
+
+    def board_color_changes(self, colors, row, i):
+        """
+        Modifies colors of a guess box on every board that was scored
+        """
+        for b in range(self.NUM_BOARDS):
+            if colors[b] != None:
+                self.renderer.set(self.board_tiles[(b, row, i + 1)],
+                    bg = self.GUESS_FRAME_COLORS[colors[b][i]], fg = self.GUESS_FRAME_TEXT_AFTER)
         
-         # Count instances of letters in the guess
-        for i in self.full_guess:
-            if i in self.letter_instances_guess:
-                self.letter_instances_guess[i] += 1
-                self.repeated_letters = True
-            else:
-                self.letter_instances_guess[i] = 1
-    
     def keyboard_frame_row(self):
         """
         Create seperate frames for each keyboard row to allow for correct key positioning and centering.
@@ -431,9 +564,9 @@ class Wordle:
 
                 button.grid(row = 0, column = c + 1, padx = self.KEYBOARD_KEYS_PADDING)
 
-                # Create dictionary containing keyboard buttons and remembering if color of button has been changed
+                # Create dictionary containing keyboard buttons
                 self.buttons[self.KEYBOARD_BUTTON_NAMES[r][c]] = button
-                self.buttons_color_changed[self.KEYBOARD_BUTTON_NAMES[r][c]] = False
+                self.renderer.track(button, fg = self.KEYBOARD_BUTTON_TEXT_BEGIN)
 
         
         # Center keyboard rows in the keyboard frame
@@ -505,6 +638,16 @@ class Wordle:
         self.control_frame_2.grid(row = 2, column = 1)
         self.control_frame_2.grid_propagate(False)
 
+        # Creates word length selector
+        self.word_size_label = tk.Label(self.control_frame_2, text = "Word length")
+        self.word_size_label.grid(row = 1, column = 1, sticky = tk.W, padx = self.USER_SELECTION_PADDING)
+        self.word_size_var = tk.StringVar()
+        self.word_size_spinbox = tk.Spinbox(self.control_frame_2, from_ = self.MIN_WORD_SIZE, to = self.MAX_WORD_SIZE,
+                            textvariable = self.word_size_var, width = 3, command = self.change_board_layout)
+        self.word_size_var.set(str(self.WORD_SIZE))
+        self.word_size_spinbox['state'] = 'readonly'
+        self.word_size_spinbox.grid(row = 1, column = 2, padx = self.USER_SELECTION_PADDING)
+
         # Creates guesses must be words checkbox
         self.checkbox_wordguesses_var = tk.BooleanVar()
         self.checkbox_wordguesses_var.set(True)
@@ -536,8 +679,39 @@ class Wordle:
         self.hidden_word_entry = tk.Entry(self.control_frame_2, textvariable=self.hidden_word_var, width = self.WORD_SIZE)
         self.hidden_word_entry.grid(row = 4, column = 2, padx = self.USER_SELECTION_PADDING)
 
+        # Creates hard mode checkbox
+        self.checkbox_hard_mode_var = tk.BooleanVar()
+        self.checkbox_hard_mode_var.set(False)
+        self.checkbox_hard_mode = tk.Checkbutton(self.control_frame_2, text="Hard mode", 
+                            var = self.checkbox_hard_mode_var)
+        self.checkbox_hard_mode.grid(row = 5, column = 1, sticky = tk.W, padx = self.USER_SELECTION_PADDING)
+
+        # Creates daily puzzle checkbox
+        self.checkbox_daily_var = tk.BooleanVar()
+        self.checkbox_daily_var.set(False)
+        self.checkbox_daily = tk.Checkbutton(self.control_frame_2, text="Daily puzzle", 
+                            var = self.checkbox_daily_var)
+        self.checkbox_daily.grid(row = 6, column = 1, sticky = tk.W, padx = self.USER_SELECTION_PADDING)
+
+        # Creates number of boards selector
+        self.boards_label = tk.Label(self.control_frame_2, text = "Boards")
+        self.boards_label.grid(row = 7, column = 1, sticky = tk.W, padx = self.USER_SELECTION_PADDING)
+        self.boards_var = tk.StringVar()
+        self.boards_spinbox = tk.Spinbox(self.control_frame_2, from_ = 1, to = self.MAX_BOARDS,
+                            textvariable = self.boards_var, width = 3, command = self.change_board_layout)
+        self.boards_var.set(str(self.NUM_BOARDS))
+        self.boards_spinbox['state'] = 'readonly'
+        self.boards_spinbox.grid(row = 7, column = 2, padx = self.USER_SELECTION_PADDING)
+
+        # Creates adversarial mode checkbox
+        self.checkbox_adversarial_var = tk.BooleanVar()
+        self.checkbox_adversarial_var.set(False)
+        self.checkbox_adversarial = tk.Checkbutton(self.control_frame_2, text="Adversarial", 
+                            var = self.checkbox_adversarial_var)
+        self.checkbox_adversarial.grid(row = 8, column = 1, sticky = tk.W, padx = self.USER_SELECTION_PADDING)
+
         self.control_frame_2.grid_rowconfigure(0, weight = 1)
-        self.control_frame_2.grid_rowconfigure(5, weight = 1)
+        self.control_frame_2.grid_rowconfigure(9, weight = 1)
 
     def control_frame_buttons(self):
         """
@@ -554,63 +728,101 @@ class Wordle:
         start_button = tk.Button(self.control_frame_3, text = "Start Game", command = self.start_game)
         start_button.grid(row = 1, column=1)
 
+        # Creates hint button
+        hint_button = tk.Button(self.control_frame_3, text = "Hint", command = self.hint)
+        hint_button.grid(row = 1, column=2)
+
         # Creates quit button
         quit_button = tk.Button(self.control_frame_3, text = "Quit", command = self.window.destroy)
-        quit_button.grid(row = 1, column=2)
+        quit_button.grid(row = 1, column=3)
 
         self.control_frame_3.grid_rowconfigure(1, weight = 1)
         self.control_frame_3.grid_columnconfigure(0, weight = 1)
-        self.control_frame_3.grid_columnconfigure(3, weight = 1)
+        self.control_frame_3.grid_columnconfigure(4, weight = 1)
 
     def read_files(self):
         """
-        Read word files and add words to two lists
+        Read word files and add words to two dictionaries
         """
-        self.short_list = []
-        self.long_list = []
-        short_file = open(self.SHORT_WORDLIST_FILENAME)
-        long_file = open(self.LONG_WORDLIST_FILENAME)
+        # Store both lists in dictionaries for constant time lookups. Both word files
+        # are parsed once into partitions by length, so later word sizes are free.
+        self.short_list = load_dictionary(self.SHORT_WORDLIST_FILENAME, self.WORD_SIZE)
+        self.long_list = load_dictionary(self.LONG_WORDLIST_FILENAME, self.WORD_SIZE)
+        # Bitset index of the guesses, for finding the guesses allowed in hard mode
+        self.long_index = load_index(self.LONG_WORDLIST_FILENAME, self.WORD_SIZE)
+        # Word frequencies, if the short list has them, make common answers more likely
+        self.answer_weights, self.answer_sampler = load_weights(self.SHORT_WORDLIST_FILENAME, self.WORD_SIZE)
+        if self.NUM_BOARDS > 1:
+            # NumPy is only needed for several boards, so it is imported when they are chosen
+            from multiboard import MultiBoardSession
+            self.session = MultiBoardSession(self.short_list, self.long_list, self.NUM_BOARDS,
+                self.WORD_SIZE, self.NUM_GUESSES, sampler = self.answer_sampler)
+        else:
+            self.session = GameSession(self.short_list, self.long_list, self.WORD_SIZE, self.NUM_GUESSES,
+                sampler = self.answer_sampler)
+
+    def change_board_layout(self):
+        """
+        Switch to the word length and number of boards chosen in the selectors and
+        rebuild the guess frame
+        """
+        if self.session.game_started == True:
+            return
+
+        self.WORD_SIZE = int(self.word_size_var.get())
+        self.NUM_BOARDS = int(self.boards_var.get())
+        self.NUM_GUESSES = self.SINGLE_BOARD_GUESSES + self.NUM_BOARDS - 1
+        self.read_files()
+        self.solver = None
 
-        # Read short file and append words to short list
-        for line in short_file:
-            line = line.split()
-            line[0].strip()
-            if len(line[0]) == self.WORD_SIZE:
-                self.short_list.append(line[0])
+        self.renderer.forget(list(self.guess_frames.values()) + list(self.letters.values())
+            + list(self.board_tiles.values()))
+        self.guess_frame.destroy()
+        self.guess_frame_method()
 
-        # Read long file and append words to long list
-        for line in long_file:
-            line = line.split()
-            line[0].strip()
-            if len(line[0]) == self.WORD_SIZE:
-                self.long_list.append(line[0])
+        # Several boards take several specified words, separated by spaces
+        self.hidden_word_entry['width'] = (self.WORD_SIZE + 1) * self.NUM_BOARDS - 1
 
     def start_game(self):
         """
         Start the game and disable necessary widgets
         """
-        if self.game_started == False:
-            found = False
-            
-            # Check if word is going to be specified, if not choose a random word
-            if self.checkbox_specify_var.get() != True:
-                self.word = random.choice(self.short_list)
-            else:
-                self.word = self.hidden_word_entry.get()
-                
-                # Check if word is correct length and show error message if not
-                if len(self.word) != self.WORD_SIZE:
-                    self.message_display(self.MESSAGE_DISPLAY_TIME_SECS, "Incorrect specified word length")
+        if self.session.game_started == False:
+            # An adversarial game has no hidden word, so it needs its own kind of session
+            adversarial = self.checkbox_adversarial_var.get()
+            if adversarial == True:
+                if self.NUM_BOARDS > 1:
+                    self.message_display(self.MESSAGE_DISPLAY_TIME_SECS, "Adversarial games use one board")
                     return
-                
-                # Check if word is a valid word (if necessary) and show error message if not
-                elif self.checkbox_wordguesses_var.get() == True:
-                    for i in self.short_list:
-                        if i == self.word:
-                            found = True
-                    if found == False:
-                        self.message_display(self.MESSAGE_DISPLAY_TIME_SECS, "Specified word not a valid word")
-                        return
+                from absurdle import AbsurdleSession
+                self.session = AbsurdleSession(self.short_list, self.long_list, self.WORD_SIZE, self.NUM_GUESSES)
+
+            # Start with today's word, the specified word, or let the session choose a random word
+            self.session.guesses_must_be_words = self.checkbox_wordguesses_var.get()
+            self.session.hard_mode = self.checkbox_hard_mode_var.get()
+            if adversarial == True:
+                error = self.session.start()
+            elif self.checkbox_daily_var.get() == True:
+                number = puzzle_number()
+                if self.NUM_BOARDS > 1:
+                    # Board b of a daily puzzle uses puzzle number * boards + b
+                    error = self.session.start([puzzle_word(self.SHORT_WORDLIST_FILENAME, self.WORD_SIZE,
+                        number * self.NUM_BOARDS + b) for b in range(self.NUM_BOARDS)])
+                else:
+                    error = self.session.start(puzzle_word(self.SHORT_WORDLIST_FILENAME, self.WORD_SIZE, number))
+                if error == None:
+                    self.message_display(self.MESSAGE_DISPLAY_TIME_SECS, "Daily puzzle #" + str(number))
+            elif self.checkbox_specify_var.get() != True:
+                error = self.session.start()
+            elif self.NUM_BOARDS > 1:
+                error = self.session.start(self.hidden_word_entry.get().split())
+            else:
+                error = self.session.start(self.hidden_word_entry.get())
+
+            # Show error message if the specified word was not accepted
+            if error != None:
+                self.message_display(self.MESSAGE_DISPLAY_TIME_SECS, error)
+                return
             
             self.show_word_command()
             
@@ -625,21 +837,198 @@ class Wordle:
             print("Guesses must be words = " + str(self.guesses_words))
             print("Show word = " + str(self.show_word))
             print("Specify word = " + str(self.specify_word))
-            print("Hidden word = " + self.word)
+            print("Hard mode = " + str(self.session.hard_mode))
+            print("Boards = " + str(self.NUM_BOARDS))
+            print("Adversarial = " + str(adversarial))
+            if adversarial == False:
+                print("Hidden word = " + self.session.word)
+
+            # Adversarial games are only saved once they are over, with the word they ended on
+            self.game_id = None
+            self.board_game_ids = []
+            if self.NUM_BOARDS > 1:
+                self.board_game_ids = [self.history_store.start_game(word, self.WORD_SIZE, self.NUM_GUESSES)
+                    for word in self.session.words]
+            elif adversarial == False:
+                self.game_id = self.history_store.start_game(self.session.word, self.WORD_SIZE, self.NUM_GUESSES)
+
+            self.disable_settings()
+
+    def disable_settings(self):
+        """
+        Disable the settings that cannot change during a game
+        """
+        self.checkbox_specify['state'] = 'disabled'
+        self.checkbox_wordguesses['state'] = 'disabled'
+        self.checkbox_hard_mode['state'] = 'disabled'
+        self.checkbox_daily['state'] = 'disabled'
+        self.hidden_word_entry['state'] = 'disabled'
+        self.word_size_spinbox['state'] = 'disabled'
+        self.boards_spinbox['state'] = 'disabled'
+        self.checkbox_adversarial['state'] = 'disabled'
+
+    def read_saved_game(self):
+        """
+        Returns (GameState, history game id) of the unfinished game saved last
+        time, or (None, None) if there is none
+        """
+        try:
+            with open(self.SAVED_GAME_FILENAME, "rb") as file:
+                data = file.read()
+            state = state_from_bytes(data[16:])
+        except (OSError, ValueError):
+            return None, None
+        if not (state.flags & STARTED) or not (self.MIN_WORD_SIZE <= state.WORD_SIZE <= self.MAX_WORD_SIZE):
+            return None, None
+        return state, (data[:16].hex() if data[:16] != bytes(16) else None)
+
+    def resume_game(self, state, game_id):
+        """
+        Carry on a saved game, redrawing its rows and keyboard without animation
+        """
+        try:
+            session = state.restore(self.short_list, self.long_list)
+        except ValueError:
+            self.message_display(self.MESSAGE_DISPLAY_TIME_SECS, "Saved game could not be resumed")
+            return
+        self.session = session
+        self.game_id = game_id
+        self.checkbox_wordguesses_var.set(self.session.guesses_must_be_words)
+        self.checkbox_hard_mode_var.set(self.session.hard_mode)
+        self.checkbox_adversarial_var.set(bool(state.flags & ADVERSARIAL))
+
+        for r in range(len(self.session.history)):
+            guess, pattern = self.session.history[r]
+            colors = decode(pattern, self.WORD_SIZE)
+            for c in range(self.WORD_SIZE):
+                self.guess_box_text[(r + 1, c + 1)] = guess[c].upper()
+                self.guess_boxes[(r + 1, c + 1)].set(guess[c].upper())
+                self.color_changes(self.GUESS_FRAME_COLORS[colors[c]], r + 1, c)
+        for letter, color in self.session.letter_colors.items():
+            self.renderer.set(self.buttons[letter.upper()], fg = self.KEYBOARD_BUTTON_COLORS[color])
+        self.redraw_row()
 
-            # Disable necessary checkboxes
-            self.checkbox_specify['state'] = 'disabled'
-            self.checkbox_wordguesses['state'] = 'disabled'
-            self.hidden_word_entry['state'] = 'disabled'
+        self.disable_settings()
+        self.message_display(self.MESSAGE_DISPLAY_TIME_SECS, "Game resumed")
 
-            self.game_started = True
+    def save_game(self):
+        """
+        Save an unfinished single board game to resume next time, or remove an old save
+        """
+        # A save that can not be written must not stop the history and profile being written
+        try:
+            if self.NUM_BOARDS == 1 and self.session.is_playing():
+                game_id = bytes.fromhex(self.game_id) if self.game_id != None else bytes(16)
+                with open(self.SAVED_GAME_FILENAME, "wb") as file:
+                    file.write(game_id + capture(self.session).to_bytes())
+            elif os.path.exists(self.SAVED_GAME_FILENAME):
+                os.remove(self.SAVED_GAME_FILENAME)
+        except OSError as error:
+            print("Game not saved: " + str(error), file = sys.stderr)
+
+    def hint(self):
+        """
+        Display the guess that gives the most information about the hidden word
+        """
+        if not self.session.is_playing():
+            return
+        if self.NUM_BOARDS > 1:
+            self.board_hint()
+            return
+
+        # Building the solver can take seconds (the pattern matrix of a new word
+        # size), so it is done by another thread and the hint is shown when it is ready
+        if self.solver == None:
+            if self.solver_loader == None:
+                self.solver_loader = threading.Thread(target = self.load_solver,
+                    args = (self.WORD_SIZE, self.answer_weights), daemon = True)
+                self.solver_loader.start()
+                self.window.after(self.SOLVER_POLL_TIME, self.solver_ready)
+            self.message_display(self.MESSAGE_DISPLAY_TIME_SECS, "Preparing hints...")
+            return
+
+        if len(self.solver.history) == 0 and self.first_hint != None:
+            # No guesses yet, so no hard mode hints either
+            best_guess = self.first_hint
+        else:
+            # In hard mode only suggest guesses that use every revealed hint
+            rows = None
+            if self.session.hard_mode == True:
+                guess_index = self.solver.patterns.guess_index
+                rows = [guess_index[word] for word in self.long_index.hard_mode_guesses(self.session.constraints)
+                    if word in guess_index]
+            best_guess = self.solver.best_guess(rows)
+        if best_guess == None:
+            self.message_display(self.MESSAGE_DISPLAY_TIME_SECS, "No words match the guesses")
+        else:
+            words_left = str(len(self.solver.candidates))
+            self.message_display(self.MESSAGE_DISPLAY_TIME_SECS, "Try " + best_guess.upper() + "\n" + words_left + " possible words left")
+
+    def load_solver(self, word_size, answer_weights):
+        """
+        Build the hint solver and find its first guess. Runs on its own thread,
+        so it must not touch any widget.
+        """
+        # NumPy is only needed for hints, so it is imported on the first one
+        from pattern_matrix import load_pattern_matrix
+        from solver import Solver
+        from opening_book import load_opening_book
+
+        try:
+            patterns = load_pattern_matrix(self.LONG_WORDLIST_FILENAME, self.SHORT_WORDLIST_FILENAME, word_size)
+        except (OSError, ValueError) as error:
+            self.loaded_solver = (word_size, None, "No hints: " + str(error))
+            return
+        if answer_weights == None:
+            solver = Solver(patterns, load_opening_book(patterns))
+        else:
+            # The opening book assumes every answer is equally likely, so it is not used with weights
+            solver = Solver(patterns, None, answer_weights)
+        self.loaded_solver = (word_size, solver, solver.best_guess())
+
+    def solver_ready(self):
+        """
+        Once the thread building the hint solver has finished, catch the solver
+        up with the guesses so far and show the hint
+        """
+        if self.solver_loader.is_alive():
+            self.window.after(self.SOLVER_POLL_TIME, self.solver_ready)
+            return
+        self.solver_loader = None
+        word_size, solver, first_hint = self.loaded_solver
+        self.loaded_solver = None
+
+        # The word size may have changed while the solver was being built
+        if word_size != self.WORD_SIZE or self.NUM_BOARDS > 1:
+            return
+        if solver == None:
+            self.message_display(self.MESSAGE_DISPLAY_TIME_SECS, first_hint)
+            return
+        for guess, pattern in self.session.history:
+            solver.update(guess, pattern)
+        self.solver = solver
+        self.first_hint = first_hint
+        self.hint()
+
+    def board_hint(self):
+        """
+        Display a word that could be the hidden word of the unsolved board with the fewest possible words
+        """
+        session = self.session
+        board = min(session.unsolved_boards(), key = lambda b: len(session.candidates[b]))
+        words = session.remaining(board)
+        if len(words) == 0:
+            self.message_display(self.MESSAGE_DISPLAY_TIME_SECS, "No words match the guesses")
+        else:
+            self.message_display(self.MESSAGE_DISPLAY_TIME_SECS, "Try " + words[0].upper() + "\nBoard "
+                + str(board + 1) + " has " + str(len(words)) + " possible words left")
 
     def show_word_command(self):
         """
         Displays selected word, if selected
         """
         if self.checkbox_show_word_var.get() == True:
-            self.display_word_var.set(self.word)
+            self.display_word_var.set(self.session.word)
         else:
             self.display_word_var.set("")
 
@@ -657,4 +1046,12 @@ class Wordle:
         self.message_var.set("")
 
 if __name__ == "__main__":
-   Wordle()
+    parser = argparse.ArgumentParser(description = "Play Wordle")
+    parser.add_argument("--word-size", type = int, default = 5, choices = range(4, 11), metavar = "4-10",
+        help = "number of letters in the hidden word")
+    parser.add_argument("--guesses", type = int, default = 6, help = "number of guesses")
+    parser.add_argument("--profile", nargs = "?", const = "1", default = None, metavar = "OUTPUT",
+        help = "print timings on exit, and write a Chrome trace (.json) or cProfile file to OUTPUT")
+    args = parser.parse_args()
+
+    Wordle(args.word_size, args.guesses, args.profile)
@@ -0,0 +1,238 @@
+"""
+File: wordlist_cache.py
+Authors: Wordle game contributors
+Date: 17 October 2026
+Description: Binary cache of a word file with its words partitioned by length.
+Every partition holds the sorted words of one length, packed back to back, and
+a fixed shuffled order of those words used to pick daily puzzles. The cache is
+loaded with one read and is rebuilt when the modification time or size of the
+word file changes. Word files may be compressed (see dictionary.open_word_file).
+Loaded partitions are also kept in memory, so switching between word sizes
+never reads or parses a file again.
+"""
+
+# Imports
+import hashlib
+import os
+import struct
+import sys
+from array import array
+from collections import Counter
+
+from dictionary import WordDictionary, dropped_message, read_partitions
+from frequency import AliasSampler, read_weights, word_weights
+from word_index import WordIndex
+
+# File layout: header, then (word size, count) for every partition, then the
+# packed words of every partition in the same order, then the puzzle order of
+# every partition as little endian uint32 indexes into its words
+MAGIC = b"WRDLCCH4"
+HEADER_FORMAT = "<8sqqI"    # magic, source mtime (ns), source size, number of partitions
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+PARTITION_FORMAT = "<II"    # word size, count
+PARTITION_SIZE = struct.calcsize(PARTITION_FORMAT)
+
+# Mixed into the hash that orders puzzles; changing it changes every daily word
+PUZZLE_SALT = b"wordle-puzzle-order-1:"
+
+# Partitions and dictionaries already loaded by this process
+loaded_partitions = {}      # filename -> (mtime, size, {word size: words}, {word size: puzzle order})
+loaded_dictionaries = {}    # (filename, word size) -> WordDictionary
+loaded_indexes = {}         # (filename, word size) -> WordIndex
+loaded_weights = {}         # (filename, word size) -> (weights, AliasSampler)
+read_weight_files = {}      # filename -> {word: weight}, or None if the file has no weights
+
+
+def cache_filename(filename):
+    """
+    Name of the cache file for a word file
+    """
+    return filename + ".cache"
+
+
+def puzzle_order(words):
+    """
+    Shuffle the indexes of a list of words in an order that depends only on the
+    words, so every machine with the same word file gets the same order
+    """
+    keys = [hashlib.sha256(PUZZLE_SALT + word.encode()).digest() for word in words]
+    order = array("I", sorted(range(len(words)), key = keys.__getitem__))
+    return order
+
+
+def read_cache(path, source_stat):
+    """
+    Return (partitions, puzzle orders) stored in a cache file, or None if the
+    cache is missing or stale
+    """
+    try:
+        with open(path, "rb") as file:
+            data = file.read()
+    except OSError:
+        return None
+
+    if len(data) < HEADER_SIZE:
+        return None
+    magic, mtime, source_size, num_partitions = struct.unpack_from(HEADER_FORMAT, data)
+    if magic != MAGIC or mtime != source_stat.st_mtime_ns or source_size != source_stat.st_size:
+        return None
+
+    table = []
+    total = 0
+    for i in range(num_partitions):
+        word_size, count = struct.unpack_from(PARTITION_FORMAT, data, HEADER_SIZE + i * PARTITION_SIZE)
+        table.append((word_size, count))
+        total += (word_size + 4) * count
+    start = HEADER_SIZE + num_partitions * PARTITION_SIZE
+    if len(data) != start + total:
+        return None
+
+    partitions = {}
+    orders = {}
+    position = start
+    for word_size, count in table:
+        end = position + word_size * count
+        text = data[position:end].decode("ascii")
+        partitions[word_size] = [text[i:i + word_size] for i in range(0, len(text), word_size)]
+        position = end
+    for word_size, count in table:
+        order = array("I")
+        order.frombytes(data[position:position + 4 * count])
+        if sys.byteorder == "big":
+            order.byteswap()
+        orders[word_size] = order
+        position += 4 * count
+    return partitions, orders
+
+
+def atomic_write(path, chunks):
+    """
+    Write byte chunks to path, replacing any old file in one step. Every
+    process writes a temp file of its own, so processes building the same
+    file at once never share one, and the temp file is removed if writing fails.
+    """
+    temp_path = path + "." + str(os.getpid()) + ".tmp"
+    try:
+        with open(temp_path, "wb") as file:
+            for chunk in chunks:
+                file.write(chunk)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_cache(path, partitions, orders, source_stat):
+    """
+    Write a cache file, replacing any old one in one step
+    """
+    sizes = sorted(partitions)
+    chunks = [struct.pack(HEADER_FORMAT, MAGIC, source_stat.st_mtime_ns, source_stat.st_size, len(sizes))]
+    for word_size in sizes:
+        chunks.append(struct.pack(PARTITION_FORMAT, word_size, len(partitions[word_size])))
+    for word_size in sizes:
+        chunks.append("".join(partitions[word_size]).encode("ascii"))
+    for word_size in sizes:
+        order = array("I", orders[word_size])
+        if sys.byteorder == "big":
+            order.byteswap()
+        chunks.append(order.tobytes())
+    atomic_write(path, chunks)
+
+
+def load_cached(filename):
+    """
+    Return ({word size: words}, {word size: puzzle order}) for a word file, using
+    the cache when it is up to date and rebuilding it when it is not
+    """
+    source_stat = os.stat(filename)
+    key = (source_stat.st_mtime_ns, source_stat.st_size)
+    if filename in loaded_partitions and loaded_partitions[filename][:2] == key:
+        return loaded_partitions[filename][2:]
+
+    path = cache_filename(filename)
+    cached = read_cache(path, source_stat)
+    if cached == None:
+        dropped = Counter()
+        partitions = read_partitions(filename, dropped = dropped)
+        if dropped:
+            print(filename + ": " + dropped_message(dropped), file = sys.stderr)
+        orders = {word_size: puzzle_order(words) for word_size, words in partitions.items()}
+        cached = (partitions, orders)
+        try:
+            write_cache(path, partitions, orders, source_stat)
+        except OSError:
+            pass
+
+    loaded_partitions[filename] = key + cached
+    return cached
+
+
+def load_partitions(filename):
+    """
+    Return {word size: sorted unique words} for a word file
+    """
+    return load_cached(filename)[0]
+
+
+def load_puzzle_order(filename, word_size):
+    """
+    Return the puzzle order of the words of the given size: puzzle n is
+    load_words(filename, word_size)[order[n % len(order)]]
+    """
+    return load_cached(filename)[1].get(word_size, array("I"))
+
+
+def load_words(filename, word_size):
+    """
+    Return the sorted, unique words of the given size in a word file
+    """
+    return load_partitions(filename).get(word_size, [])
+
+
+def load_dictionary(filename, word_size):
+    """
+    Return a WordDictionary of the words of the given size in a word file,
+    building it only the first time it is asked for
+    """
+    partitions = load_partitions(filename)
+    key = (filename, word_size)
+    if key not in loaded_dictionaries or loaded_dictionaries[key][0] is not partitions:
+        loaded_dictionaries[key] = (partitions, WordDictionary(partitions.get(word_size, [])))
+    return loaded_dictionaries[key][1]
+
+
+def load_index(filename, word_size):
+    """
+    Return a WordIndex of the words of the given size in a word file, building
+    it only the first time it is asked for
+    """
+    partitions = load_partitions(filename)
+    key = (filename, word_size)
+    if key not in loaded_indexes or loaded_indexes[key][0] is not partitions:
+        loaded_indexes[key] = (partitions, WordIndex(partitions.get(word_size, [])))
+    return loaded_indexes[key][1]
+
+
+def load_weights(filename, word_size):
+    """
+    Return (weights, AliasSampler) for the words of the given size in a word
+    file, with the weights in the order of load_words, or (None, None) if the
+    word file has no weights. Built only the first time it is asked for.
+    """
+    partitions = load_partitions(filename)
+    key = (filename, word_size)
+    if key not in loaded_weights or loaded_weights[key][0] is not partitions:
+        if filename not in read_weight_files:
+            read_weight_files[filename] = read_weights(filename)
+        weights = read_weight_files[filename]
+        words = partitions.get(word_size, [])
+        if weights == None or len(words) == 0:
+            loaded_weights[key] = (partitions, None, None)
+        else:
+            ordered = word_weights(words, weights)
+            loaded_weights[key] = (partitions, ordered, AliasSampler(ordered))
+    return loaded_weights[key][1:]